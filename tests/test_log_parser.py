@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from utils.log_parser import (
+    ERROR_JAM,
+    ERROR_MOTOR,
+    ERROR_SENSOR,
+    ERROR_SWITCH,
+    LogParser,
+    _ERROR_FIELDS,
+)
+
+
+_HEADER = "10:00:00.000|DEV01 Event (proto.c,583):OnRecv\nHEX DUMP\n"
+
+
+class ParseLogHexDumpTest(unittest.TestCase):
+    def test_plain_dump_line(self):
+        entries = LogParser.parse_log(
+            _HEADER + "0000h  02 00 24 01 02 03   ......\n"
+        )
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["hex_data"], bytes([2, 0, 0x24, 1, 2, 3]))
+        self.assertEqual(entries[0]["event_code"], 0x24)
+
+    def test_ascii_column_starting_with_hex_characters(self):
+        entries = LogParser.parse_log(
+            _HEADER + "0000h 02 00 23 41 20 42 43  A BC\n"
+        )
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["hex_data"], bytes([2, 0, 0x23, 0x41, 0x20, 0x42, 0x43]))
+
+    def test_ascii_column_with_long_hex_like_token(self):
+        entries = LogParser.parse_log(
+            _HEADER + "0000h 02 00 48 41 42 43  ABC\n"
+        )
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["hex_data"], bytes([2, 0, 0x48, 0x41, 0x42, 0x43]))
+
+    def test_ascii_column_starting_with_hex_pair(self):
+        entries = LogParser.parse_log(
+            _HEADER + "0000h  41 42 20 43  AB C\n"
+        )
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["hex_data"], bytes([0x41, 0x42, 0x20, 0x43]))
+
+    def test_ascii_column_starting_with_hex_pair_on_middle_line(self):
+        entries = LogParser.parse_log(
+            _HEADER
+            + "0000h  41 42 20 43 44 45 20 46  AB CDE F\n"
+            + "0010h  02 00  ..\n"
+        )
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(
+            entries[0]["hex_data"],
+            bytes([0x41, 0x42, 0x20, 0x43, 0x44, 0x45, 0x20, 0x46, 0x02, 0x00]),
+        )
+
+
+
+_RECORD_A = (
+    "10:00:00.000|DEV01 Event (proto.c,583):OnRecv\n"
+    "HEX DUMP\n"
+    "0000h  02 00 24 01   ....\n"
+)
+_RECORD_B = (
+    "10:00:01.001|DEV01 Event (proto.c,868):OnRecv\n"
+    "HEX DUMP\n"
+    "0000h  02 00 23 05   ....\n"
+)
+
+
+class ParseLogBlocksTest(unittest.TestCase):
+    def test_several_blank_and_whitespace_lines_between_records(self):
+        entries = LogParser.parse_log(_RECORD_A + "\n  \n\t\n\n" + _RECORD_B)
+
+        self.assertEqual([e["timestamp"] for e in entries], ["10:00:00.000", "10:00:01.001"])
+        self.assertEqual(entries[1]["hex_data"], bytes([2, 0, 0x23, 5]))
+
+    def test_header_only_record_is_skipped(self):
+        entries = LogParser.parse_log(
+            _RECORD_A + "\n10:00:00.500|DEV01 Event (proto.c,1):OnRecv\n\n" + _RECORD_B
+        )
+
+        self.assertEqual([e["timestamp"] for e in entries], ["10:00:00.000", "10:00:01.001"])
+
+    def test_record_with_only_hex_dump_line(self):
+        entries = LogParser.parse_log(
+            "10:00:00.000|DEV01 Event (proto.c,583):OnRecv\nHEX DUMP\n"
+        )
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["hex_data"], b"")
+        self.assertNotIn("event_code", entries[0])
+
+    def test_last_record_without_trailing_newline(self):
+        entries = LogParser.parse_log(_RECORD_A + "\n" + _RECORD_B.rstrip("\n"))
+
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[1]["hex_data"], bytes([2, 0, 0x23, 5]))
+
+    def test_indented_header(self):
+        entries = LogParser.parse_log("   " + _RECORD_A)
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["identifier"], "DEV01")
+        self.assertEqual(entries[0]["event_code"], 0x24)
+
+    def test_trailing_blanks_on_last_dump_line(self):
+        entries = LogParser.parse_log(
+            "10:00:00.000|DEV01 Event (proto.c,583):OnRecv\n"
+            "HEX DUMP\n"
+            "0000h  02 00 24 01 02 03 04 05 06 07 08 09 0A 0B 0C 0D\n"
+            "0010h  0E 0F   \t\n"
+        )
+
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["hex_data"], bytes([2, 0, 0x24]) + bytes(range(1, 16)))
+
+
+
+def _error_payload(**values):
+    """Собирает данные события 0x48 с заданными значениями полей по именам."""
+    names = [field[0] for field in _ERROR_FIELDS]
+    data = bytearray(len(names))
+    for name, value in values.items():
+        data[names.index(name)] = value
+    return bytes([0x02, 0x00, 0x48]) + bytes(data)
+
+
+class ParseErrorInfoActionFlagsTest(unittest.TestCase):
+    def test_no_active_fields(self):
+        result = LogParser.parse_error_info(_error_payload())
+
+        self.assertEqual(result["action_flags"], 0)
+        self.assertEqual(result["active_error_count"], 0)
+
+    def test_jam_sensor(self):
+        result = LogParser.parse_error_info(_error_payload(jam_sensor=1))
+
+        self.assertEqual(result["action_flags"], ERROR_JAM | ERROR_SENSOR)
+
+    def test_door_switch(self):
+        result = LogParser.parse_error_info(_error_payload(l_door_switch=1))
+
+        self.assertEqual(result["action_flags"], ERROR_SWITCH)
+
+    def test_flags_are_combined(self):
+        result = LogParser.parse_error_info(
+            _error_payload(reverse_motor=1, l_door_switch=1)
+        )
+
+        self.assertEqual(result["action_flags"], ERROR_MOTOR | ERROR_SWITCH)
+
+    def test_banknote_trans_fail_adds_no_flag(self):
+        result = LogParser.parse_error_info(_error_payload(banknote_trans_fail=3))
+
+        self.assertTrue(result["errors_detected"])
+        self.assertEqual(result["active_error_count"], 1)
+        self.assertEqual(result["action_flags"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,181 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from PyQt5.QtWidgets import (QMainWindow, QTextEdit, QPushButton, QVBoxLayout, 
+from PyQt5.QtWidgets import (QMainWindow, QTextEdit, QPlainTextEdit, QPushButton, QVBoxLayout, 
                              QHBoxLayout, QFileDialog, QWidget, QLabel, QStatusBar,
                              QSpacerItem, QSizePolicy, QTabWidget, QMessageBox,
                              QTableWidget, QTableWidgetItem, QHeaderView)
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtCore import Qt, QThreadPool, QTimer
+from PyQt5.QtGui import QBrush, QFont, QFontDatabase, QIcon
+from operator import itemgetter
 import os
-from utils.file_loader import FileLoader
-from utils.log_parser import LogParser
+from utils.log_parser import (LogParser, ERROR_SENSOR, ERROR_JAM, ERROR_MOTOR,
+                              ERROR_COMMUNICATION, ERROR_SWITCH)
+from ui.workers import ParseWorker, AnalyzeWorker
+
+
+def _hex(data):
+    """Форматирует байты в строку шестнадцатеричных значений через пробел."""
+    return data.hex(' ').upper()
+
+
+# Рекомендуемые действия для категорий сработавших полей события 0x48
+_ERROR_ACTIONS = (
+    (ERROR_SENSOR, "<li>Проверить и очистить сенсоры устройства</li>"),
+    (ERROR_JAM, "<li>Проверить на замятие банкнот</li>"),
+    (ERROR_MOTOR, "<li>Проверить работу двигателей</li>"),
+    (ERROR_COMMUNICATION, "<li>Проверить подключение кабелей и перезагрузить устройство</li>"),
+    (ERROR_SWITCH, "<li>Проверить закрытие всех дверец и крышек</li>"),
+)
+
+
+# Справка по кодам ошибок под таблицей отчета 0x48
+_ERROR_REFERENCE_HTML = (
+    "<h4>Справка по основным кодам ошибок:</h4>"
+    "<ul>"
+    "<li><b>BID Mismatch Error</b> - Несоответствие идентификатора банкноты</li>"
+    "<li><b>Wrong Stacker Error</b> - Ошибка подачи банкноты в неправильный накопитель</li>"
+    "<li><b>Banknote Tear Error</b> - Обнаружена порванная банкнота</li>"
+    "<li><b>Chain Error</b> - Проблема с последовательностью обработки банкнот</li>"
+    "<li><b>Sensor Detected</b> - Сенсор обнаружил нештатную ситуацию</li>"
+    "</ul>"
+)
+
+
+# Построчный анализ логов длиннее порога выводится порциями через таймер
+_LINE_PROGRESSIVE_THRESHOLD = 2000
+_LINE_CHUNK_SIZE = 500
+
+# Стили построчного анализа задаются один раз для документа, а не в каждом блоке
+_LINE_STYLE_SHEET = (
+    ".entry { margin-bottom: 20px; border-bottom: 1px solid #ccc; padding-bottom: 10px; }"
+    ".decoded { background-color: #f9f9f9; padding: 10px; border-left: 3px solid #4CAF50; }"
+)
+
+# Шаблоны расшифровки записи просчета (событие 0x24) для построчного анализа.
+# Каждый формат выводится одним шаблоном без ветвлений по отдельным полям.
+_COUNT_DECODE_TEMPLATES = {
+    'KD': (
+        "<p><b>Формат данных:</b> KD</p>"
+        "<p><b>Последний просчет:</b></p>"
+        "<ul>"
+        "<li>Вставлено банкнот: {insert_count_last}</li>"
+        "<li>Внесено в хранилище: {deposit_count_last}</li>"
+        "<li>Отклонено банкнот: {reject_count_last}</li>"
+        "<li>Попыток вставки: {insert_try_count}</li>"
+        "</ul>"
+        "<p><b>Общий просчет:</b></p>"
+        "<ul>"
+        "<li>Всего вставлено: {insert_count_total}</li>"
+        "<li>Всего внесено: {deposit_count_total}</li>"
+        "<li>Всего отклонено: {reject_count_total}</li>"
+        "</ul>"
+    ),
+    'KR1': (
+        "<p><b>Формат данных:</b> KR1</p>"
+        "<p><b>Результаты просчета:</b></p>"
+        "<ul>"
+        "<li>Отклонено банкнот: {reject_count}</li>"
+        "<li>Помещено в кассету: {cassette_count}</li>"
+        "<li>Помещено в Drum1: {drum1_count}</li>"
+        "<li>Помещено в Drum2: {drum2_count}</li>"
+        "<li>Помещено в Drum3: {drum3_count}</li>"
+        "<li>Помещено в Drum4: {drum4_count}</li>"
+        "</ul>"
+    ),
+    'KR2': (
+        "<p><b>Формат данных:</b> KR2</p>"
+        "<p><b>Направление барабанов:</b> {drum_direction}</p>"
+        "<p><b>Последний просчет:</b></p>"
+        "<ul>"
+        "<li>Вставлено банкнот: {insert_count_last}</li>"
+        "<li>Отклонено банкнот: {reject_count_last}</li>"
+        "<li>Помещено в кассету: {cassette_count_last}</li>"
+        "<li>Помещено в Drum1: {drum1_count_last}</li>"
+        "<li>Помещено в Drum2: {drum2_count_last}</li>"
+        "<li>Помещено в Drum3: {drum3_count_last}</li>"
+        "<li>Помещено в Drum4: {drum4_count_last}</li>"
+        "</ul>"
+        "<p><b>Общее количество в устройстве:</b></p>"
+        "<ul>"
+        "<li>В кассете: {cassette_count_total}</li>"
+        "<li>В Drum1: {drum1_count_total}</li>"
+        "<li>В Drum2: {drum2_count_total}</li>"
+        "<li>В Drum3: {drum3_count_total}</li>"
+        "<li>В Drum4: {drum4_count_total}</li>"
+        "</ul>"
+    ),
+}
+_COUNT_DECODE_UNKNOWN = "<p><b>Формат данных:</b> {format}</p>"
+
+# Шаблоны строк таблицы результатов просчета (событие 0x24) по форматам данных
+_CALC_ROWS = {
+    'KD': (
+        "<tr><td>{ts}</td><td>KD</td>"
+        "<td>Вставлено: {insert_count_last}<br>"
+        "Внесено: {deposit_count_last}<br>"
+        "Отклонено: {reject_count_last}</td>"
+        "<td>Вставлено: {insert_count_total}<br>"
+        "Внесено: {deposit_count_total}<br>"
+        "Отклонено: {reject_count_total}</td>"
+        "<td>Попыток вставки: {insert_try_count}</td></tr>"
+    ),
+    'KR1': (
+        "<tr><td>{ts}</td><td>KR1</td>"
+        "<td>Отклонено: {reject_count}<br>"
+        "Кассета: {cassette_count}</td>"
+        "<td>Drum1: {drum1_count}<br>"
+        "Drum2: {drum2_count}<br>"
+        "Drum3: {drum3_count}<br>"
+        "Drum4: {drum4_count}</td>"
+        "<td></td></tr>"
+    ),
+    'KR2': (
+        "<tr><td>{ts}</td><td>KR2</td>"
+        "<td>Вставлено: {insert_count_last}<br>"
+        "Отклонено: {reject_count_last}<br>"
+        "Кассета: {cassette_count_last}<br>"
+        "Drum1: {drum1_count_last}<br>"
+        "Drum2: {drum2_count_last}<br>"
+        "Drum3: {drum3_count_last}<br>"
+        "Drum4: {drum4_count_last}</td>"
+        "<td>Кассета: {cassette_count_total}<br>"
+        "Drum1: {drum1_count_total}<br>"
+        "Drum2: {drum2_count_total}<br>"
+        "Drum3: {drum3_count_total}<br>"
+        "Drum4: {drum4_count_total}</td>"
+        "<td>Направление: {drum_direction}</td></tr>"
+    ),
+}
+_CALC_UNKNOWN_ROW = "<tr><td>{0}</td><td>{1}</td><td></td><td></td><td></td></tr>"
+_CALC_ERROR_ROW = "<tr><td>{0}</td><td colspan='4'>Ошибка парсинга: {1}</td></tr>"
+
+
+class _CountFields(dict):
+    """Поля результата просчета для шаблонов: отсутствующие счетчики выводятся как 0."""
+
+    def __missing__(self, key):
+        return 0
+
+
+# Поля результата LogParser.parse_banknote_info в порядке, в котором их
+# используют расшифровка записи и строка таблицы банкнот
+_get_banknote_decode_fields = itemgetter(
+    'banknote_no', 'sc_error', 'sc_error_text', 'note_destination', 'destination_text',
+    'serial_text', 'recognition_code', 'recognition_error', 'encoder', 'denom_info',
+    'decimal_point', 'denom_use_flag'
+)
+_get_banknote_row_fields = itemgetter(
+    'banknote_no', 'sc_error', 'sc_error_text', 'recognition_code', 'destination_text',
+    'serial_text', 'denom_info', 'recognition_error', 'encoder'
+)
+
+# Заголовки столбцов таблицы банкнот (событие 0x23)
+_BANKNOTE_COLUMNS = (
+    "Время", "№ банкноты", "Результат", "Код распознавания",
+    "Назначение", "Серийный номер", "Информация"
+)
+
 
 class MainWindow(QMainWindow):
     """
@@ -27,22 +193,32 @@ class MainWindow(QMainWindow):
         event_codes (dict): Словарь соответствия кодов событий их описаниям.
         current_file (str): Путь к текущему открытому файлу.
         parsed_logs (list): Список разобранных записей лога.
-        text_display (QTextEdit): Область отображения исходного лога.
+        text_display (QPlainTextEdit): Область отображения исходного лога.
         line_by_line_display (QTextEdit): Область построчного анализа.
         summary_display (QTextEdit): Область отображения общей статистики.
-        event_tabs (dict): Словарь с вкладками для каждого типа события.
+        event_pages (dict): Словарь со страницами-заготовками вкладок для каждого типа события.
+        event_tabs (dict): Словарь с областями отображения событий, созданными при первом открытии вкладки.
+        event_labels (dict): Словарь с подписями над табличными вкладками событий.
+        analysis_results (dict): Результаты последнего анализа или None, если анализ не выполнялся.
 
     Methods:
-        load_file(): Открывает диалог выбора файла и загружает его содержимое.
-        analyze_log(): Выполняет анализ загруженного лога и отображает результаты.
+        load_file(): Открывает диалог выбора файла и запускает его фоновую загрузку.
+        _on_file_loaded(result): Отображает загруженный и разобранный файл.
+        analyze_log(): Запускает фоновый анализ загруженного лога.
+        _on_analysis_finished(analysis_results): Отображает результаты анализа.
+        _on_tab_changed(index): Строит содержимое основной вкладки при ее первом открытии.
+        _on_analysis_tab_changed(index): Строит вкладку события при ее первом открытии.
         _display_line_by_line_analysis(parsed_logs): Отображает построчный анализ с расшифровкой каждой записи.
+        _render_next_line_chunk(): Дописывает очередную порцию записей построчного анализа.
+        _append_line_entry(parts, i, entry): Добавляет HTML-разметку одной записи.
         _display_summary(analysis_results): Отображает сводную статистику по логу.
         _display_event_analysis(code, description, events): Отображает анализ для конкретного типа события.
+        _decode_generic(entry): Возвращает расшифровку для событий без специальной обработки.
         _decode_count_info(entry): Расшифровывает информацию о просчете банкнот.
         _decode_banknote_info(entry): Расшифровывает информацию о конкретной банкноте.
         _decode_error_info(entry): Расшифровывает информацию об ошибках устройства.
         _format_calculation_results(events): Форматирует результаты просчета банкнот для отображения.
-        _format_detailed_accounting(events): Форматирует детальную информацию по обработанным банкнотам.
+        _fill_banknote_table(table, events): Заполняет таблицу детальной информации по обработанным банкнотам.
         _format_errors(events): Форматирует информацию об ошибках для отображения.
         _format_generic_events(events): Форматирует информацию о других типах событий.
 
@@ -66,8 +242,27 @@ class MainWindow(QMainWindow):
             0x48: "Ошибка"
         }
         
+        self._decode_dispatch = {
+            0x24: self._decode_count_info,
+            0x23: self._decode_banknote_info,
+            0x48: self._decode_error_info
+        }
+        self._format_dispatch = {
+            0x24: self._format_calculation_results,
+            0x48: self._format_errors
+        }
+        self._table_dispatch = {
+            0x23: self._fill_banknote_table
+        }
+        
         self.current_file = None
         self.parsed_logs = []
+        self.analysis_results = None
+        self._logs_version = 0
+        self._rendered_versions = {}
+        self._decoded_html = {}
+        self._line_render_state = None
+        self._worker = None
         self.full_ui_initialized = False
         
         self.init_welcome_ui()
@@ -124,9 +319,13 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.statusBar)
         self.statusBar.showMessage("Готов к работе")
         
-    def init_full_ui(self):
+    def init_full_ui(self, content=None, file_name=None):
         """
         Инициализирует полный пользовательский интерфейс приложения после загрузки файла.
+        
+        Аргументы:
+            content (str): Уже загруженное содержимое лог-файла для вкладки исходного лога
+            file_name (str): Имя загруженного файла для отображения рядом с кнопкой загрузки
         """
         if self.full_ui_initialized:
             return
@@ -142,7 +341,7 @@ class MainWindow(QMainWindow):
         self.load_button.clicked.connect(self.load_file)
         button_layout.addWidget(self.load_button)
         
-        self.file_label = QLabel(os.path.basename(self.current_file) if self.current_file else "Файл не выбран")
+        self.file_label = QLabel(file_name or "Файл не выбран")
         button_layout.addWidget(self.file_label)
         
         button_layout.addItem(QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum))
@@ -156,16 +355,23 @@ class MainWindow(QMainWindow):
         
         self.tab_widget = QTabWidget()
         
-        self.text_display = QTextEdit()
+        mono_font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+        mono_font.setStyleHint(QFont.Monospace)
+        mono_font.setFixedPitch(True)
+        mono_font.setKerning(False)
+        
+        self.text_display = QPlainTextEdit()
         self.text_display.setReadOnly(True)
-        if self.current_file:
-            content = FileLoader.load_file(self.current_file)
-            if content:
-                self.text_display.setPlainText(content)
+        self.text_display.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.text_display.setFont(mono_font)
+        if content:
+            self.text_display.setPlainText(content)
         self.tab_widget.addTab(self.text_display, "Исходный лог")
         
         self.line_by_line_display = QTextEdit()
         self.line_by_line_display.setReadOnly(True)
+        self.line_by_line_display.setFont(mono_font)
+        self.line_by_line_display.document().setDefaultStyleSheet(_LINE_STYLE_SHEET)
         self.tab_widget.addTab(self.line_by_line_display, "Построчный анализ")
         
         self.analysis_tab = QWidget()
@@ -177,15 +383,19 @@ class MainWindow(QMainWindow):
         self.summary_display.setReadOnly(True)
         self.analysis_tabs.addTab(self.summary_display, "Общие результаты")
         
+        self.event_pages = {}
         self.event_tabs = {}
+        self.event_labels = {}
         for code, description in self.event_codes.items():
-            event_display = QTextEdit()
-            event_display.setReadOnly(True)
-            self.event_tabs[code] = event_display
-            self.analysis_tabs.addTab(event_display, f"Событие {hex(code)} ({code}): {description}")
+            event_page = QWidget()
+            QVBoxLayout(event_page).setContentsMargins(0, 0, 0, 0)
+            self.event_pages[code] = event_page
+            self.analysis_tabs.addTab(event_page, f"Событие {hex(code)} ({code}): {description}")
+        self.analysis_tabs.currentChanged.connect(self._on_analysis_tab_changed)
         
         self.analysis_layout.addWidget(self.analysis_tabs)
         self.tab_widget.addTab(self.analysis_tab, "Анализ")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         main_layout.addWidget(self.tab_widget)
         
@@ -198,10 +408,10 @@ class MainWindow(QMainWindow):
         
     def load_file(self):
         """
-        Открывает диалог выбора файла и загружает его содержимое.
+        Открывает диалог выбора файла и запускает его загрузку в фоновом потоке.
         
-        При успешной загрузке файла, его содержимое отображается в интерфейсе
-        и становится доступной кнопка анализа.
+        Чтение и разбор файла выполняются в пуле потоков, чтобы интерфейс
+        не блокировался на больших логах. Результат обрабатывает _on_file_loaded.
         """
         file_path, _ = QFileDialog.getOpenFileName(
             self,
@@ -211,113 +421,354 @@ class MainWindow(QMainWindow):
         )
         
         if file_path:
-            self.current_file = file_path
-            
-            if not self.full_ui_initialized:
-                self.init_full_ui()
-            else:
-                self.file_label.setText(os.path.basename(file_path))
-            
-            content = FileLoader.load_file(file_path)
+            self._set_busy(True)
+            self.statusBar.showMessage(f"Загрузка файла: {file_path}...")
             
+            self._worker = ParseWorker(file_path)
+            self._worker.signals.finished.connect(self._on_file_loaded)
+            self._worker.signals.failed.connect(self._on_file_load_failed)
+            QThreadPool.globalInstance().start(self._worker)
+    
+    def _on_file_loaded(self, result):
+        """
+        Отображает содержимое загруженного файла и результаты его разбора.
+        
+        При успешной загрузке файла, его содержимое отображается в интерфейсе
+        и становится доступной кнопка анализа.
+        
+        Аргументы:
+            result (tuple): Путь к файлу, его содержимое, размер в байтах и список разобранных записей
+        """
+        file_path, content, file_size, parsed_logs = result
+        file_name = os.path.basename(file_path)
+        self._worker = None
+        self.current_file = file_path
+        
+        if not self.full_ui_initialized:
+            self.init_full_ui(content, file_name)
+        else:
+            self.file_label.setText(file_name)
             if content:
+                self.text_display.setUpdatesEnabled(False)
+                self.text_display.blockSignals(True)
                 self.text_display.setPlainText(content)
-                
-                self.parsed_logs = LogParser.parse_log(content)
-                
-                file_size = os.path.getsize(file_path)
-                log_count = len(self.parsed_logs)
-                self.statusBar.showMessage(f"Загружен файл: {file_path} ({file_size} байт), найдено {log_count} записей")
-                
-                self.analyze_button.setEnabled(True)
-                
-                self.tab_widget.setCurrentIndex(0)
-            else:
-                QMessageBox.critical(self, "Ошибка", "Не удалось загрузить файл!")
+                self.text_display.blockSignals(False)
+                self.text_display.setUpdatesEnabled(True)
+        
+        if content:
+            self.parsed_logs = parsed_logs
+            self.analysis_results = None
+            self._logs_version += 1
+            self._decoded_html.clear()
+            
+            log_count = len(self.parsed_logs)
+            self.statusBar.showMessage(f"Загружен файл: {file_path} ({file_size} байт), найдено {log_count} записей")
+            
+            self._set_busy(False)
+            self.analyze_button.setEnabled(True)
+            
+            self.tab_widget.setCurrentIndex(0)
+        else:
+            self._set_busy(False)
+            self.statusBar.showMessage("Не удалось загрузить файл")
+            QMessageBox.critical(self, "Ошибка", "Не удалось загрузить файл!")
+    
+    def _on_file_load_failed(self, message):
+        """
+        Сообщает об исключении при загрузке или разборе файла.
+        
+        Аргументы:
+            message (str): Текст исключения фоновой задачи
+        """
+        self._on_worker_failed("Не удалось загрузить файл", message)
+    
+    def _on_analysis_failed(self, message):
+        """
+        Сообщает об исключении при анализе логов.
+        
+        Аргументы:
+            message (str): Текст исключения фоновой задачи
+        """
+        self._on_worker_failed("Не удалось выполнить анализ логов", message)
+    
+    def _on_worker_failed(self, title, message):
+        """
+        Снимает блокировку кнопок и показывает ошибку фоновой задачи.
+        
+        Аргументы:
+            title (str): Описание неудавшейся операции
+            message (str): Текст исключения фоновой задачи
+        """
+        self._worker = None
+        self._set_busy(False)
+        self.statusBar.showMessage(title)
+        QMessageBox.critical(self, "Ошибка", f"{title}!\n{message}")
+    
+    def _set_busy(self, busy):
+        """
+        Блокирует кнопки загрузки и анализа на время фоновой операции
+        
+        Аргументы:
+            busy (bool): True, если фоновая операция выполняется
+        """
+        if not self.full_ui_initialized:
+            self.welcome_load_button.setEnabled(not busy)
+            return
+        
+        self.load_button.setEnabled(not busy)
+        self.analyze_button.setEnabled(not busy and bool(self.parsed_logs))
     
     def analyze_log(self):
         """
-        Выполняет анализ загруженного лога и отображает результаты.
+        Запускает анализ загруженного лога в фоновом потоке.
         
-        Запускает процесс анализа лога, формирует различные представления
-        результатов и отображает их в соответствующих вкладках интерфейса.
+        Группировка событий выполняется в пуле потоков, результаты
+        отображает _on_analysis_finished.
         """
         if not self.current_file or not self.parsed_logs:
             return
         
-        analysis_results = LogParser.analyze_events(self.parsed_logs, self.event_codes)
+        if self.analysis_results is not None:
+            self._on_analysis_finished(self.analysis_results)
+            return
+        
+        self._set_busy(True)
+        self.statusBar.showMessage("Выполняется анализ логов...")
         
-        self._display_summary(analysis_results)
+        self._worker = AnalyzeWorker(self.parsed_logs, self.event_codes)
+        self._worker.signals.finished.connect(self._on_analysis_finished)
+        self._worker.signals.failed.connect(self._on_analysis_failed)
+        QThreadPool.globalInstance().start(self._worker)
+    
+    def _on_analysis_finished(self, analysis_results):
+        """
+        Отображает результаты анализа в соответствующих вкладках интерфейса.
         
-        self._display_line_by_line_analysis(self.parsed_logs)
+        Аргументы:
+            analysis_results (dict): Результаты анализа логов
+        """
+        self._worker = None
+        self.analysis_results = analysis_results
         
-        for code, description in self.event_codes.items():
-            self._display_event_analysis(code, description, analysis_results['events_by_code'].get(code, []))
+        displays = [self.summary_display, self.line_by_line_display, *self.event_tabs.values()]
+        self.tab_widget.setUpdatesEnabled(False)
+        for display in displays:
+            display.blockSignals(True)
         
-        self.tab_widget.setCurrentIndex(1)  
+        try:
+            if self._needs_render('summary'):
+                self._display_summary(self.analysis_results)
+            
+            self.tab_widget.setCurrentIndex(1)
+            self._on_tab_changed(self.tab_widget.currentIndex())
+        finally:
+            for display in displays:
+                display.blockSignals(False)
+            self.tab_widget.setUpdatesEnabled(True)
+        
+        self._set_busy(False)
         self.statusBar.showMessage("Анализ логов завершен")
 
+    def _on_tab_changed(self, index):
+        """
+        Строит содержимое основной вкладки при первом ее открытии после анализа
+        
+        Аргументы:
+            index (int): Индекс выбранной вкладки
+        """
+        if self.analysis_results is None:
+            return
+        
+        widget = self.tab_widget.widget(index)
+        
+        if widget is self.line_by_line_display:
+            if self._needs_render('lines'):
+                self._display_line_by_line_analysis(self.parsed_logs)
+        elif widget is self.analysis_tab:
+            self._on_analysis_tab_changed(self.analysis_tabs.currentIndex())
+
+    def _on_analysis_tab_changed(self, index):
+        """
+        Создает область отображения вкладки события и заполняет ее при первом открытии
+        
+        Аргументы:
+            index (int): Индекс выбранной вкладки анализа
+        """
+        if self.analysis_results is None:
+            return
+        
+        page = self.analysis_tabs.widget(index)
+        
+        for code, description in self.event_codes.items():
+            if self.event_pages.get(code) is not page:
+                continue
+            
+            if not self._needs_render(code):
+                return
+            
+            if code not in self.event_tabs:
+                if code in self._table_dispatch:
+                    summary_label = QLabel()
+                    page.layout().addWidget(summary_label)
+                    self.event_labels[code] = summary_label
+                    
+                    event_display = QTableWidget(0, len(_BANKNOTE_COLUMNS))
+                    event_display.setHorizontalHeaderLabels(list(_BANKNOTE_COLUMNS))
+                    event_display.setEditTriggers(QTableWidget.NoEditTriggers)
+                    event_display.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+                    event_display.horizontalHeader().setStretchLastSection(True)
+                else:
+                    event_display = QTextEdit()
+                    event_display.setReadOnly(True)
+                page.layout().addWidget(event_display)
+                self.event_tabs[code] = event_display
+            
+            self._display_event_analysis(code, description, self.analysis_results['events_by_code'].get(code, []))
+            return
+
+    def _needs_render(self, key):
+        """
+        Проверяет, нужно ли перестраивать вкладку, и отмечает ее как актуальную
+        
+        Вкладка перестраивается, только если она еще не отображала
+        текущую версию разобранного лога.
+        
+        Аргументы:
+            key: Ключ вкладки ('summary', 'lines' или код события)
+            
+        Возвращает:
+            bool: True, если содержимое вкладки нужно построить заново
+        """
+        if self._rendered_versions.get(key) == self._logs_version:
+            return False
+        self._rendered_versions[key] = self._logs_version
+        return True
+
     def _display_line_by_line_analysis(self, parsed_logs):
         """
         Отображает построчный анализ логов с расшифровкой каждой записи
         
+        Небольшие логи отображаются целиком. Для логов длиннее
+        _LINE_PROGRESSIVE_THRESHOLD записи дописываются порциями по
+        _LINE_CHUNK_SIZE через таймер, чтобы интерфейс оставался отзывчивым.
+        Кэш расшифровок _decoded_html живет только в пределах одного прохода
+        и очищается по его завершении.
+        
         Аргументы:
             parsed_logs (list): Список разобранных записей лога
         """
-        html = "<h2>Построчный анализ логов</h2>"
+        header = "<h2>Построчный анализ логов</h2>"
+        self._line_render_state = None
         
         if not parsed_logs:
-            html += "<p>Логи не содержат записей для анализа.</p>"
-            self.line_by_line_display.setHtml(html)
+            self.line_by_line_display.setHtml(header + "<p>Логи не содержат записей для анализа.</p>")
             return
         
-        html += "<div style='font-family: monospace;'>"
-        
-        for i, entry in enumerate(parsed_logs):
-            html += f"<div style='margin-bottom: 20px; border-bottom: 1px solid #ccc; padding-bottom: 10px;'>"
-            html += f"<h3>Запись #{i+1}</h3>"
+        if len(parsed_logs) <= _LINE_PROGRESSIVE_THRESHOLD:
+            parts = [header]
+            for i, entry in enumerate(parsed_logs):
+                self._append_line_entry(parts, i, entry)
             
-            timestamp = entry['timestamp']
-            event_type = entry['event_type']
-            source = f"{entry['source_file']}:{entry['line_number']}"
-            function = entry['function']
-            
-            html += f"<p><b>Время:</b> {timestamp} | <b>Тип:</b> {event_type} | <b>Источник:</b> {source} | <b>Функция:</b> {function}</p>"
+            self.line_by_line_display.setHtml("".join(parts))
+            self._decoded_html.clear()
+            return
+        
+        self.line_by_line_display.setHtml(header)
+        self._line_render_state = (parsed_logs, 0, self._logs_version)
+        QTimer.singleShot(0, self._render_next_line_chunk)
+
+    def _render_next_line_chunk(self):
+        """
+        Дописывает в построчный анализ очередную порцию записей
+        
+        Прекращает работу, если после запуска был загружен другой файл.
+        """
+        if self._line_render_state is None:
+            return
+        
+        parsed_logs, start, version = self._line_render_state
+        
+        if version != self._logs_version:
+            self._line_render_state = None
+            self._decoded_html.clear()
+            return
+        
+        end = min(start + _LINE_CHUNK_SIZE, len(parsed_logs))
+        
+        parts = []
+        for i in range(start, end):
+            self._append_line_entry(parts, i, parsed_logs[i])
+        
+        scroll_bar = self.line_by_line_display.verticalScrollBar()
+        position = scroll_bar.value()
+        self.line_by_line_display.append("".join(parts))
+        scroll_bar.setValue(position)
+        
+        if end < len(parsed_logs):
+            self._line_render_state = (parsed_logs, end, version)
+            self.statusBar.showMessage(f"Построчный анализ: обработано {end} из {len(parsed_logs)} записей")
+            QTimer.singleShot(0, self._render_next_line_chunk)
+        else:
+            self._line_render_state = None
+            self._decoded_html.clear()
+            self.statusBar.showMessage("Анализ логов завершен")
+
+    def _append_line_entry(self, parts, i, entry):
+        """
+        Добавляет HTML-разметку одной записи построчного анализа
+        
+        Аргументы:
+            parts (list): Список фрагментов HTML, в который добавляется запись
+            i (int): Порядковый номер записи в логе
+            entry (dict): Запись лога
+        """
+        parts.append("<div class='entry'>")
+        parts.append(f"<h3>Запись #{i+1}</h3>")
+        
+        timestamp = entry['timestamp']
+        event_type = entry['event_type']
+        source = f"{entry['source_file']}:{entry['line_number']}"
+        function = entry['function']
+        
+        parts.append(f"<p><b>Время:</b> {timestamp} | <b>Тип:</b> {event_type} | <b>Источник:</b> {source} | <b>Функция:</b> {function}</p>")
+        
+        if 'hex_data' in entry and entry['hex_data']:
+            hex_str = _hex(entry['hex_data'])
+            parts.append(f"<p><b>Сырые данные:</b> <span style='color:#666'>{hex_str}</span></p>")
+        
+        parts.append("<div class='decoded'>")
+        parts.append("<h4>Расшифровка:</h4>")
+        
+        if 'event_code' in entry:
+            event_code = entry['event_code']
+            parts.append(f"<p><b>Код события:</b> {hex(event_code)} ({event_code}) - {self.event_codes.get(event_code, 'Неизвестное событие')}</p>")
             
-            if 'hex_data' in entry and entry['hex_data']:
-                hex_str = ' '.join([f"{b:02X}" for b in entry['hex_data']])
-                html += f"<p><b>Сырые данные:</b> <span style='color:#666'>{hex_str}</span></p>"
+            payload = entry['hex_data']
+            decoded = self._decoded_html.get(payload)
             
-            html += "<div style='background-color:#f9f9f9; padding:10px; border-left:3px solid #4CAF50;'>"
-            html += "<h4>Расшифровка:</h4>"
+            if decoded is None:
+                decoded = self._decode_dispatch.get(event_code, self._decode_generic)(entry)
+                self._decoded_html[payload] = decoded
             
-            if 'event_code' in entry:
-                event_code = entry['event_code']
-                html += f"<p><b>Код события:</b> {hex(event_code)} ({event_code})"
-                
-                if event_code in self.event_codes:
-                    html += f" - {self.event_codes[event_code]}</p>"
-                else:
-                    html += " - Неизвестное событие</p>"
-                
-                if event_code == 0x24:
-                    html += self._decode_count_info(entry)
-                elif event_code == 0x23:
-                    html += self._decode_banknote_info(entry)
-                elif event_code == 0x48:
-                    html += self._decode_error_info(entry)
-                else:
-                    html += "<p>Подробная расшифровка недоступна для этого типа события.</p>"
-            else:
-                html += "<p>Не удалось определить код события.</p>"
-                
-            html += "</div>"
+            parts.append(decoded)
+        else:
+            parts.append("<p>Не удалось определить код события.</p>")
             
-            html += "</div>"
+        parts.append("</div>")
         
-        html += "</div>"
+        parts.append("</div>")
+
+    def _decode_generic(self, entry):
+        """
+        Возвращает расшифровку для событий без специальной обработки
         
-        self.line_by_line_display.setHtml(html)
+        Аргументы:
+            entry (dict): Запись лога
+            
+        Возвращает:
+            str: HTML-разметка с сообщением об отсутствии расшифровки
+        """
+        return "<p>Подробная расшифровка недоступна для этого типа события.</p>"
 
     def _decode_count_info(self, entry):
         """
@@ -329,72 +780,22 @@ class MainWindow(QMainWindow):
         Возвращает:
             str: HTML-разметка с расшифрованной информацией
         """
-        html = "<div style='margin-left:15px;'>"
+        parts = ["<div style='margin-left:15px;'>"]
         
         try:
             count_data = LogParser.parse_count_info(entry['hex_data'])
             
             if 'error' in count_data:
-                return html + f"<p>Ошибка расшифровки данных счета: {count_data['error']}</p></div>"
-                
-            format_type = count_data.get('format', 'Неизвестный')
-            html += f"<p><b>Формат данных:</b> {format_type}</p>"
-            
-            if format_type == 'KD':
-                html += "<p><b>Последний просчет:</b></p>"
-                html += "<ul>"
-                html += f"<li>Вставлено банкнот: {count_data.get('insert_count_last', 0)}</li>"
-                html += f"<li>Внесено в хранилище: {count_data.get('deposit_count_last', 0)}</li>"
-                html += f"<li>Отклонено банкнот: {count_data.get('reject_count_last', 0)}</li>"
-                html += f"<li>Попыток вставки: {count_data.get('insert_try_count', 0)}</li>"
-                html += "</ul>"
-                
-                html += "<p><b>Общий просчет:</b></p>"
-                html += "<ul>"
-                html += f"<li>Всего вставлено: {count_data.get('insert_count_total', 0)}</li>"
-                html += f"<li>Всего внесено: {count_data.get('deposit_count_total', 0)}</li>"
-                html += f"<li>Всего отклонено: {count_data.get('reject_count_total', 0)}</li>"
-                html += "</ul>"
+                parts.append(f"<p>Ошибка расшифровки данных счета: {count_data['error']}</p></div>")
+                return "".join(parts)
                 
-            elif format_type == 'KR1':
-                html += "<p><b>Результаты просчета:</b></p>"
-                html += "<ul>"
-                html += f"<li>Отклонено банкнот: {count_data.get('reject_count', 0)}</li>"
-                html += f"<li>Помещено в кассету: {count_data.get('cassette_count', 0)}</li>"
-                html += f"<li>Помещено в Drum1: {count_data.get('drum1_count', 0)}</li>"
-                html += f"<li>Помещено в Drum2: {count_data.get('drum2_count', 0)}</li>"
-                html += f"<li>Помещено в Drum3: {count_data.get('drum3_count', 0)}</li>"
-                html += f"<li>Помещено в Drum4: {count_data.get('drum4_count', 0)}</li>"
-                html += "</ul>"
-                
-            elif format_type == 'KR2':
-                direction = count_data.get('drum_direction', 'Неизвестно')
-                html += f"<p><b>Направление барабанов:</b> {direction}</p>"
-                
-                html += "<p><b>Последний просчет:</b></p>"
-                html += "<ul>"
-                html += f"<li>Вставлено банкнот: {count_data.get('insert_count_last', 0)}</li>"
-                html += f"<li>Отклонено банкнот: {count_data.get('reject_count_last', 0)}</li>"
-                html += f"<li>Помещено в кассету: {count_data.get('cassette_count_last', 0)}</li>"
-                html += f"<li>Помещено в Drum1: {count_data.get('drum1_count_last', 0)}</li>"
-                html += f"<li>Помещено в Drum2: {count_data.get('drum2_count_last', 0)}</li>"
-                html += f"<li>Помещено в Drum3: {count_data.get('drum3_count_last', 0)}</li>"
-                html += f"<li>Помещено в Drum4: {count_data.get('drum4_count_last', 0)}</li>"
-                html += "</ul>"
-                
-                html += "<p><b>Общее количество в устройстве:</b></p>"
-                html += "<ul>"
-                html += f"<li>В кассете: {count_data.get('cassette_count_total', 0)}</li>"
-                html += f"<li>В Drum1: {count_data.get('drum1_count_total', 0)}</li>"
-                html += f"<li>В Drum2: {count_data.get('drum2_count_total', 0)}</li>"
-                html += f"<li>В Drum3: {count_data.get('drum3_count_total', 0)}</li>"
-                html += f"<li>В Drum4: {count_data.get('drum4_count_total', 0)}</li>"
-                html += "</ul>"
+            template = _COUNT_DECODE_TEMPLATES.get(count_data.get('format'), _COUNT_DECODE_UNKNOWN)
+            parts.append(template.format_map(_CountFields(count_data)))
         except Exception as e:
-            html += f"<p>Ошибка при расшифровке данных: {str(e)}</p>"
+            parts.append(f"<p>Ошибка при расшифровке данных: {str(e)}</p>")
         
-        html += "</div>"
-        return html
+        parts.append("</div>")
+        return "".join(parts)
 
     def _decode_banknote_info(self, entry):
         """
@@ -406,49 +807,46 @@ class MainWindow(QMainWindow):
         Возвращает:
             str: HTML-разметка с расшифрованной информацией
         """
-        html = "<div style='margin-left:15px;'>"
+        parts = ["<div style='margin-left:15px;'>"]
         
         try:
             banknote_data = LogParser.parse_banknote_info(entry['hex_data'])
             
             if 'error' in banknote_data:
-                return html + f"<p>Ошибка расшифровки данных банкноты: {banknote_data['error']}</p></div>"
+                parts.append(f"<p>Ошибка расшифровки данных банкноты: {banknote_data['error']}</p></div>")
+                return "".join(parts)
             
-            html += f"<p><b>Номер банкноты:</b> {banknote_data['banknote_no']}</p>"
+            (banknote_no, sc_error, sc_error_text, dest, dest_text, serial,
+             recognition_code, recognition_error, encoder, denom_info,
+             decimal_point, denom_use_flag) = _get_banknote_decode_fields(banknote_data)
             
-            sc_error = banknote_data['sc_error']
-            sc_error_text = banknote_data.get('sc_error_text', 'Неизвестно')
+            parts.append(f"<p><b>Номер банкноты:</b> {banknote_no}</p>")
             
             if sc_error == 0:
-                html += "<p><b>Статус:</b> <span style='color:green'>Успешно</span></p>"
+                parts.append("<p><b>Статус:</b> <span style='color:green'>Успешно</span></p>")
             else:
-                html += f"<p><b>Статус:</b> <span style='color:red'>Ошибка {sc_error}: {sc_error_text}</span></p>"
+                parts.append(f"<p><b>Статус:</b> <span style='color:red'>Ошибка {sc_error}: {sc_error_text}</span></p>")
             
-            dest = banknote_data['note_destination']
-            dest_text = banknote_data.get('destination_text', 'Неизвестно')
-            html += f"<p><b>Назначение:</b> {dest_text} (код: {dest})</p>"
+            parts.append(f"<p><b>Назначение:</b> {dest_text} (код: {dest})</p>")
             
-            serial = banknote_data.get('serial_text', 'Н/Д')
-            html += f"<p><b>Серийный номер:</b> {serial}</p>"
+            parts.append(f"<p><b>Серийный номер:</b> {serial}</p>")
             
-            recog_code = ' '.join([f"{b:02X}" for b in banknote_data['recognition_code']])
-            html += f"<p><b>Код распознавания:</b> {recog_code}</p>"
+            parts.append(f"<p><b>Код распознавания:</b> {_hex(recognition_code)}</p>")
             
-            recog_error = ' '.join([f"{b:02X}" for b in banknote_data['recognition_error']])
-            html += f"<p><b>Код ошибки распознавания:</b> {recog_error}</p>"
+            parts.append(f"<p><b>Код ошибки распознавания:</b> {_hex(recognition_error)}</p>")
             
-            html += "<p><b>Дополнительные данные:</b></p>"
-            html += "<ul>"
-            html += f"<li>Encoder: {' '.join([f'{b:02X}' for b in banknote_data['encoder']])}</li>"
-            html += f"<li>Denom info: {' '.join([f'{b:02X}' for b in banknote_data['denom_info']])}</li>"
-            html += f"<li>Decimal point: {banknote_data['decimal_point']}</li>"
-            html += f"<li>Denom use flag: {banknote_data['denom_use_flag']}</li>"
-            html += "</ul>"
+            parts.append("<p><b>Дополнительные данные:</b></p>")
+            parts.append("<ul>")
+            parts.append(f"<li>Encoder: {_hex(encoder)}</li>")
+            parts.append(f"<li>Denom info: {_hex(denom_info)}</li>")
+            parts.append(f"<li>Decimal point: {decimal_point}</li>")
+            parts.append(f"<li>Denom use flag: {denom_use_flag}</li>")
+            parts.append("</ul>")
         except Exception as e:
-            html += f"<p>Ошибка при расшифровке данных: {str(e)}</p>"
+            parts.append(f"<p>Ошибка при расшифровке данных: {str(e)}</p>")
         
-        html += "</div>"
-        return html
+        parts.append("</div>")
+        return "".join(parts)
 
     def _decode_error_info(self, entry):
         """
@@ -460,30 +858,31 @@ class MainWindow(QMainWindow):
         Возвращает:
             str: HTML-разметка с расшифрованной информацией
         """
-        html = "<div style='margin-left:15px;'>"
+        parts = ["<div style='margin-left:15px;'>"]
         
         try:
-            error_data = LogParser.parse_error_info(entry['hex_data'])
+            error_data = LogParser.parse_error_info(entry['hex_data'], full=True)
             
             if 'error' in error_data:
-                return html + f"<p>Ошибка расшифровки данных: {error_data['error']}</p></div>"
+                parts.append(f"<p>Ошибка расшифровки данных: {error_data['error']}</p></div>")
+                return "".join(parts)
             
             error_count = error_data.get('active_error_count', 0)
             
             if error_count > 0:
-                html += f"<p><b>Обнаружены ошибки:</b> <span style='color:red'>{error_count}</span></p>"
+                parts.append(f"<p><b>Обнаружены ошибки:</b> <span style='color:red'>{error_count}</span></p>")
                 
-                html += "<p><b>Активные ошибки:</b></p>"
-                html += "<ul style='color:red'>"
+                parts.append("<p><b>Активные ошибки:</b></p>")
+                parts.append("<ul style='color:red'>")
                 for error in error_data.get('active_errors', []):
-                    html += f"<li>{error}</li>"
-                html += "</ul>"
+                    parts.append(f"<li>{error}</li>")
+                parts.append("</ul>")
             else:
-                html += "<p><b>Статус устройства:</b> <span style='color:green'>Нормальное состояние, ошибок не обнаружено</span></p>"
+                parts.append("<p><b>Статус устройства:</b> <span style='color:green'>Нормальное состояние, ошибок не обнаружено</span></p>")
             
-            html += "<p><b>Подробная информация о статусе компонентов:</b></p>"
-            html += "<table border='1' cellpadding='3' style='font-size:90%'>"
-            html += "<tr><th>Компонент</th><th>Статус</th><th>Область применения</th></tr>"
+            parts.append("<p><b>Подробная информация о статусе компонентов:</b></p>")
+            parts.append("<table border='1' cellpadding='3' style='font-size:90%'>")
+            parts.append("<tr><th>Компонент</th><th>Статус</th><th>Область применения</th></tr>")
             
             for field_name, field_data in error_data.get('fields', {}).items():
                 if field_name.startswith('reserved'):
@@ -502,19 +901,19 @@ class MainWindow(QMainWindow):
                     status = "Нормально"
                     color = "green"
                     
-                html += f"<tr><td>{component}</td><td style='color:{color}'>{status}</td><td>{scope}</td></tr>"
+                parts.append(f"<tr><td>{component}</td><td style='color:{color}'>{status}</td><td>{scope}</td></tr>")
                 
-            html += "</table>"
+            parts.append("</table>")
             
-            html += "<p><details><summary>Сырые данные</summary>"
-            html += f"<pre>{' '.join([f'{b:02X}' for b in error_data['raw_data']])}</pre>"
-            html += "</details></p>"
+            parts.append("<p><details><summary>Сырые данные</summary>")
+            parts.append(f"<pre>{_hex(error_data['raw_data'])}</pre>")
+            parts.append("</details></p>")
             
         except Exception as e:
-            html += f"<p>Ошибка при расшифровке данных: {str(e)}</p>"
+            parts.append(f"<p>Ошибка при расшифровке данных: {str(e)}</p>")
         
-        html += "</div>"
-        return html
+        parts.append("</div>")
+        return "".join(parts)
 
     def _display_summary(self, analysis_results):
         """
@@ -523,25 +922,25 @@ class MainWindow(QMainWindow):
         Аргументы:
             analysis_results (dict): Результаты анализа логов
         """
-        html = "<h2>Сводка анализа логов</h2>"
+        parts = ["<h2>Сводка анализа логов</h2>"]
         
-        html += f"<p><b>Всего записей в логе:</b> {len(self.parsed_logs)}</p>"
+        parts.append(f"<p><b>Всего записей в логе:</b> {len(self.parsed_logs)}</p>")
         
-        html += "<h3>Сводка по событиям</h3>"
-        html += "<table border='1' cellpadding='5' width='100%'>"
-        html += "<tr><th>Код события</th><th>Описание</th><th>Количество</th><th>Первое появление</th><th>Последнее появление</th></tr>"
+        parts.append("<h3>Сводка по событиям</h3>")
+        parts.append("<table border='1' cellpadding='5' width='100%'>")
+        parts.append("<tr><th>Код события</th><th>Описание</th><th>Количество</th><th>Первое появление</th><th>Последнее появление</th></tr>")
         
         for code, data in analysis_results['event_summary'].items():
             description = data['description']
             count = data['count']
-            first = data['first_occurrence'].strftime('%H:%M:%S.%f')[:-3] if data['first_occurrence'] else 'н/д'
-            last = data['last_occurrence'].strftime('%H:%M:%S.%f')[:-3] if data['last_occurrence'] else 'н/д'
+            first = data['first_timestamp'] or 'н/д'
+            last = data['last_timestamp'] or 'н/д'
             
-            html += f"<tr><td>{hex(code)} ({code})</td><td>{description}</td><td>{count}</td><td>{first}</td><td>{last}</td></tr>"
+            parts.append(f"<tr><td>{hex(code)} ({code})</td><td>{description}</td><td>{count}</td><td>{first}</td><td>{last}</td></tr>")
             
-        html += "</table>"
+        parts.append("</table>")
         
-        self.summary_display.setHtml(html)
+        self.summary_display.setHtml("".join(parts))
     
     def _display_event_analysis(self, code, description, events):
         """
@@ -555,24 +954,26 @@ class MainWindow(QMainWindow):
         if code not in self.event_tabs:
             return
         
-        html = f"<h2>Событие {hex(code)} ({code}): {description}</h2>"
-        html += f"<p><b>Всего найдено:</b> {len(events)} событий</p>"
+        fill_table = self._table_dispatch.get(code)
+        
+        if fill_table is not None:
+            self.event_labels[code].setText(
+                f"<b>Событие {hex(code)} ({code}): {description}</b> — всего найдено: {len(events)} событий"
+            )
+            fill_table(self.event_tabs[code], events)
+            return
+        
+        parts = [f"<h2>Событие {hex(code)} ({code}): {description}</h2>"]
+        parts.append(f"<p><b>Всего найдено:</b> {len(events)} событий</p>")
         
         if not events:
-            html += "<p>События данного типа не обнаружены в логе.</p>"
-            self.event_tabs[code].setHtml(html)
+            parts.append("<p>События данного типа не обнаружены в логе.</p>")
+            self.event_tabs[code].setHtml("".join(parts))
             return
         
-        if code == 0x24:
-            html += self._format_calculation_results(events)
-        elif code == 0x23:
-            html += self._format_detailed_accounting(events)
-        elif code == 0x48:
-            html += self._format_errors(events)
-        else:
-            html += self._format_generic_events(events)
+        parts.append(self._format_dispatch.get(code, self._format_generic_events)(events))
         
-        self.event_tabs[code].setHtml(html)
+        self.event_tabs[code].setHtml("".join(parts))
     
     def _format_calculation_results(self, events):
         """
@@ -584,16 +985,12 @@ class MainWindow(QMainWindow):
         Возвращает:
             str: HTML-разметка с отформатированными результатами
         """
-        html = "<h3>Результаты просчета банкнот</h3>"
+        header = "<h3>Результаты просчета банкнот</h3>"
         
         if not events:
-            html += "<p>События данного типа не обнаружены в логе.</p>"
-            return html
-        
-        html += f"<p><b>Всего просчетов:</b> {len(events)}</p>"
+            return header + "<p>События данного типа не обнаружены в логе.</p>"
         
-        html += "<table border='1' cellpadding='5' width='100%'>"
-        html += "<tr><th>Время</th><th>Формат</th><th>Последний просчет</th><th>Общий просчет</th><th>Подробности</th></tr>"
+        rows = []
         
         for event in events:
             timestamp = event['timestamp']
@@ -601,122 +998,83 @@ class MainWindow(QMainWindow):
             count_data = LogParser.parse_count_info(event['hex_data'])
             
             if 'error' in count_data:
-                html += f"<tr><td>{timestamp}</td><td colspan='4'>Ошибка парсинга: {count_data['error']}</td></tr>"
+                rows.append(_CALC_ERROR_ROW.format(timestamp, count_data['error']))
                 continue
             
-            format_type = count_data.get('format', 'Неизвестный')
-            
-            last_count = ""
-            total_count = ""
-            details = ""
-            
-            if format_type == 'KD':
-                last_count = (
-                    f"Вставлено: {count_data.get('insert_count_last', 0)}<br>"
-                    f"Внесено: {count_data.get('deposit_count_last', 0)}<br>"
-                    f"Отклонено: {count_data.get('reject_count_last', 0)}"
-                )
-                
-                total_count = (
-                    f"Вставлено: {count_data.get('insert_count_total', 0)}<br>"
-                    f"Внесено: {count_data.get('deposit_count_total', 0)}<br>"
-                    f"Отклонено: {count_data.get('reject_count_total', 0)}"
-                )
-                
-                details = f"Попыток вставки: {count_data.get('insert_try_count', 0)}"
-                
-            elif format_type == 'KR1':
-                last_count = (
-                    f"Отклонено: {count_data.get('reject_count', 0)}<br>"
-                    f"Кассета: {count_data.get('cassette_count', 0)}"
-                )
-                
-                total_count = (
-                    f"Drum1: {count_data.get('drum1_count', 0)}<br>"
-                    f"Drum2: {count_data.get('drum2_count', 0)}<br>"
-                    f"Drum3: {count_data.get('drum3_count', 0)}<br>"
-                    f"Drum4: {count_data.get('drum4_count', 0)}"
-                )
-                
-            elif format_type == 'KR2':
-                last_count = (
-                    f"Вставлено: {count_data.get('insert_count_last', 0)}<br>"
-                    f"Отклонено: {count_data.get('reject_count_last', 0)}<br>"
-                    f"Кассета: {count_data.get('cassette_count_last', 0)}<br>"
-                    f"Drum1: {count_data.get('drum1_count_last', 0)}<br>"
-                    f"Drum2: {count_data.get('drum2_count_last', 0)}<br>"
-                    f"Drum3: {count_data.get('drum3_count_last', 0)}<br>"
-                    f"Drum4: {count_data.get('drum4_count_last', 0)}"
-                )
-                
-                total_count = (
-                    f"Кассета: {count_data.get('cassette_count_total', 0)}<br>"
-                    f"Drum1: {count_data.get('drum1_count_total', 0)}<br>"
-                    f"Drum2: {count_data.get('drum2_count_total', 0)}<br>"
-                    f"Drum3: {count_data.get('drum3_count_total', 0)}<br>"
-                    f"Drum4: {count_data.get('drum4_count_total', 0)}"
-                )
-                
-                details = f"Направление: {count_data.get('drum_direction', 'Неизвестно')}"
+            template = _CALC_ROWS.get(count_data.get('format'))
             
-            html += f"<tr><td>{timestamp}</td><td>{format_type}</td><td>{last_count}</td><td>{total_count}</td><td>{details}</td></tr>"
+            if template is None:
+                rows.append(_CALC_UNKNOWN_ROW.format(timestamp, count_data.get('format', 'Неизвестный')))
+                continue
             
-        html += "</table>"
-        return html
+            fields = _CountFields(count_data)
+            fields['ts'] = timestamp
+            rows.append(template.format_map(fields))
+        
+        return "".join([
+            header,
+            f"<p><b>Всего просчетов:</b> {len(events)}</p>",
+            "<table border='1' cellpadding='5' width='100%'>",
+            "<tr><th>Время</th><th>Формат</th><th>Последний просчет</th><th>Общий просчет</th><th>Подробности</th></tr>",
+            *rows,
+            "</table>",
+        ])
     
-    def _format_detailed_accounting(self, events):
+    def _fill_banknote_table(self, table, events):
         """
-        Форматирует детальную информацию по обработанным банкнотам (событие 0x23)
+        Заполняет таблицу детальной информации по обработанным банкнотам (событие 0x23)
+        
+        Таблица заполняется напрямую, без HTML: число строк задается заранее,
+        а перерисовка и сортировка отключаются на время заполнения.
         
         Аргументы:
+            table (QTableWidget): Таблица для заполнения
             events (list): Список событий с информацией о банкнотах
-            
-        Возвращает:
-            str: HTML-разметка с отформатированной информацией
         """
-        html = "<h3>Подробная информация по счету банкнот</h3>"
-        
-        if not events:
-            html += "<p>События данного типа не обнаружены в логе.</p>"
-            return html
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.clearContents()
+        table.setRowCount(len(events))
         
-        html += f"<p><b>Всего банкнот обработано:</b> {len(events)}</p>"
-        
-        html += "<table border='1' cellpadding='5' width='100%'>"
-        html += "<tr><th>Время</th><th>№ банкноты</th><th>Результат</th><th>Код распознавания</th><th>Назначение</th><th>Серийный номер</th><th>Информация</th></tr>"
-        
-        for event in events:
-            timestamp = event['timestamp']
+        for row, event in enumerate(events):
+            table.setItem(row, 0, QTableWidgetItem(event['timestamp']))
             
             banknote_data = LogParser.parse_banknote_info(event['hex_data'])
             
             if 'error' in banknote_data:
-                html += f"<tr><td>{timestamp}</td><td colspan='6'>Ошибка парсинга: {banknote_data['error']}</td></tr>"
+                table.setItem(row, 2, QTableWidgetItem(f"Ошибка парсинга: {banknote_data['error']}"))
                 continue
             
-            banknote_no = banknote_data['banknote_no']
+            (banknote_no, sc_error, sc_error_text, recognition_code, destination_text,
+             serial_text, denom_info, recognition_error, encoder) = _get_banknote_row_fields(banknote_data)
             
-            if banknote_data['sc_error'] == 0:
-                result = "<span style='color:green'>Успешно</span>"
-            else:
-                result = f"<span style='color:red'>Ошибка: {banknote_data['sc_error_text']}</span>"
-                
-            recog_code = ' '.join([f"{b:02X}" for b in banknote_data['recognition_code']])
+            number_item = QTableWidgetItem()
+            number_item.setData(Qt.DisplayRole, banknote_no)
+            table.setItem(row, 1, number_item)
             
-            destination = banknote_data['destination_text']
-            serial = banknote_data['serial_text']
-            
-            denom_info = ' '.join([f"{b:02X}" for b in banknote_data['denom_info']])
-            info = (
-                f"Denom: {denom_info}<br>"
-                f"Ошибка распознавания: {' '.join([f'{b:02X}' for b in banknote_data['recognition_error']])}<br>"
-                f"Энкодер: {' '.join([f'{b:02X}' for b in banknote_data['encoder']])}"
-            )
-            
-            html += f"<tr><td>{timestamp}</td><td>{banknote_no}</td><td>{result}</td><td>{recog_code}</td><td>{destination}</td><td>{serial}</td><td>{info}</td></tr>"
+            if sc_error == 0:
+                result_item = QTableWidgetItem("Успешно")
+                result_item.setForeground(QBrush(Qt.darkGreen))
+            else:
+                result_item = QTableWidgetItem(f"Ошибка: {sc_error_text}")
+                result_item.setForeground(QBrush(Qt.red))
+            table.setItem(row, 2, result_item)
             
-        html += "</table>"
-        return html
+            table.setItem(row, 3, QTableWidgetItem(_hex(recognition_code)))
+            table.setItem(row, 4, QTableWidgetItem(destination_text))
+            table.setItem(row, 5, QTableWidgetItem(serial_text))
+            table.setItem(row, 6, QTableWidgetItem(
+                f"Denom: {_hex(denom_info)}; "
+                f"Ошибка распознавания: {_hex(recognition_error)}; "
+                f"Энкодер: {_hex(encoder)}"
+            ))
+        
+        # setSortingEnabled(True) сразу сортирует по индикатору заголовка
+        # (по умолчанию столбец 0 по убыванию); сброс индикатора сохраняет
+        # порядок записей в файле до щелчка пользователя по заголовку
+        table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        table.setSortingEnabled(True)
+        table.setUpdatesEnabled(True)
     
     def _format_errors(self, events):
         """
@@ -728,16 +1086,16 @@ class MainWindow(QMainWindow):
         Возвращает:
             str: HTML-разметка с отформатированной информацией об ошибках
         """
-        html = "<h3>Отчет об ошибках системы</h3>"
+        parts = ["<h3>Отчет об ошибках системы</h3>"]
         
         if not events:
-            html += "<p>События об ошибках не обнаружены в логе.</p>"
-            return html
+            parts.append("<p>События об ошибках не обнаружены в логе.</p>")
+            return "".join(parts)
         
-        html += f"<p><b>Всего записей об ошибках:</b> {len(events)}</p>"
+        parts.append(f"<p><b>Всего записей об ошибках:</b> {len(events)}</p>")
         
-        html += "<table border='1' cellpadding='5' width='100%'>"
-        html += "<tr><th>Время</th><th>Кол-во ошибок</th><th>Основные проблемы</th><th>Действия</th></tr>"
+        parts.append("<table border='1' cellpadding='5' width='100%'>")
+        parts.append("<tr><th>Время</th><th>Кол-во ошибок</th><th>Основные проблемы</th><th>Действия</th></tr>")
         
         for event in events:
             timestamp = event['timestamp']
@@ -745,7 +1103,7 @@ class MainWindow(QMainWindow):
             error_data = LogParser.parse_error_info(event['hex_data'])
             
             if 'error' in error_data:
-                html += f"<tr><td>{timestamp}</td><td colspan='3'>Ошибка парсинга: {error_data['error']}</td></tr>"
+                parts.append(f"<tr><td>{timestamp}</td><td colspan='3'>Ошибка парсинга: {error_data['error']}</td></tr>")
                 continue
             
             error_count = error_data.get('active_error_count', 0)
@@ -753,7 +1111,7 @@ class MainWindow(QMainWindow):
             main_issues = ""
             if error_count > 0:
                 active_errors = error_data.get('active_errors', [])
-                display_errors = active_errors[:3]
+                display_errors = list(active_errors[:3])
                 if len(active_errors) > 3:
                     display_errors.append(f"...и еще {len(active_errors) - 3}")
                     
@@ -763,42 +1121,20 @@ class MainWindow(QMainWindow):
             
             actions = ""
             if error_count > 0:
-                actions = "<ul>"
-                
-                if any('sensor' in e.lower() for e in error_data.get('active_errors', [])):
-                    actions += "<li>Проверить и очистить сенсоры устройства</li>"
-                    
-                if any('jam' in e.lower() for e in error_data.get('active_errors', [])):
-                    actions += "<li>Проверить на замятие банкнот</li>"
-                    
-                if any('motor' in e.lower() for e in error_data.get('active_errors', [])):
-                    actions += "<li>Проверить работу двигателей</li>"
-                    
-                if any('communication' in e.lower() for e in error_data.get('active_errors', [])):
-                    actions += "<li>Проверить подключение кабелей и перезагрузить устройство</li>"
-                    
-                if any('switch' in e.lower() or 'door' in e.lower() for e in error_data.get('active_errors', [])):
-                    actions += "<li>Проверить закрытие всех дверец и крышек</li>"
-                    
-                actions += "</ul>"
+                action_flags = error_data['action_flags']
+                actions = "<ul>" + "".join(
+                    item for flag, item in _ERROR_ACTIONS if action_flags & flag
+                ) + "</ul>"
             else:
                 actions = "Действия не требуются"
             
             error_cell_color = "red" if error_count > 0 else "green"
-            html += f"<tr><td>{timestamp}</td><td style='color:{error_cell_color}'>{error_count}</td><td>{main_issues}</td><td>{actions}</td></tr>"
-        
-        html += "</table>"
+            parts.append(f"<tr><td>{timestamp}</td><td style='color:{error_cell_color}'>{error_count}</td><td>{main_issues}</td><td>{actions}</td></tr>")
         
-        html += "<h4>Справка по основным кодам ошибок:</h4>"
-        html += "<ul>"
-        html += "<li><b>BID Mismatch Error</b> - Несоответствие идентификатора банкноты</li>"
-        html += "<li><b>Wrong Stacker Error</b> - Ошибка подачи банкноты в неправильный накопитель</li>"
-        html += "<li><b>Banknote Tear Error</b> - Обнаружена порванная банкнота</li>"
-        html += "<li><b>Chain Error</b> - Проблема с последовательностью обработки банкнот</li>"
-        html += "<li><b>Sensor Detected</b> - Сенсор обнаружил нештатную ситуацию</li>"
-        html += "</ul>"
+        parts.append("</table>")
+        parts.append(_ERROR_REFERENCE_HTML)
         
-        return html
+        return "".join(parts)
     
     def _format_generic_events(self, events):
         """
@@ -810,16 +1146,16 @@ class MainWindow(QMainWindow):
         Возвращает:
             str: HTML-разметка с отформатированной информацией
         """
-        html = "<table border='1' cellpadding='5' width='100%'>"
-        html += "<tr><th>Время</th><th>Идентификатор</th><th>Тип события</th><th>Данные</th></tr>"
+        parts = ["<table border='1' cellpadding='5' width='100%'>",
+                 "<tr><th>Время</th><th>Идентификатор</th><th>Тип события</th><th>Данные</th></tr>"]
         
         for event in events:
             timestamp = event['timestamp']
             identifier = event['identifier']
             event_type = event['event_type']
-            data = ' '.join([f"{b:02X}" for b in event['hex_data']])
+            data = _hex(event['hex_data'])
             
-            html += f"<tr><td>{timestamp}</td><td>{identifier}</td><td>{event_type}</td><td>{data}</td></tr>"
+            parts.append(f"<tr><td>{timestamp}</td><td>{identifier}</td><td>{event_type}</td><td>{data}</td></tr>")
             
-        html += "</table>"
-        return html
\ No newline at end of file
+        parts.append("</table>")
+        return "".join(parts)
\ No newline at end of file
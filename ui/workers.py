@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from utils.file_loader import FileLoader
+from utils.log_parser import LogParser
+
+
+class WorkerSignals(QObject):
+    """
+    Сигналы фоновых задач.
+
+    QRunnable не является QObject, поэтому сигналы вынесены в отдельный объект.
+    Сигнал доставляется в слот главного потока через очередь событий Qt.
+
+    Attributes:
+        finished (pyqtSignal): Испускается с результатом задачи после ее завершения.
+        failed (pyqtSignal): Испускается с текстом исключения, если задача завершилась ошибкой.
+    """
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class ParseWorker(QRunnable):
+    """
+    Фоновая задача загрузки и разбора лог-файла.
+
+    По завершении испускает signals.finished с кортежем
+    (путь к файлу, содержимое или None, размер в байтах, список разобранных записей),
+    при исключении - signals.failed с его текстом.
+    """
+    def __init__(self, file_path):
+        """
+        Аргументы:
+            file_path (str): Путь к загружаемому лог-файлу
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """
+        Загружает файл и разбирает его содержимое вне потока интерфейса.
+
+        Исключение не должно покинуть run(): PyQt завершает приложение
+        при необработанном исключении в пуле потоков.
+        """
+        try:
+            content, file_size = FileLoader.load_file(self.file_path, with_size=True)
+            parsed_logs = LogParser.parse_log(content) if content else []
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit((self.file_path, content, file_size, parsed_logs))
+
+
+class AnalyzeWorker(QRunnable):
+    """
+    Фоновая задача анализа разобранных записей лога.
+
+    По завершении испускает signals.finished со словарем результатов
+    LogParser.analyze_events, при исключении - signals.failed с его текстом.
+    """
+    def __init__(self, parsed_logs, event_codes):
+        """
+        Аргументы:
+            parsed_logs (list): Список разобранных записей лога
+            event_codes (dict): Словарь кодов событий для анализа {код: описание}
+        """
+        super().__init__()
+        self.parsed_logs = parsed_logs
+        self.event_codes = event_codes
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """
+        Группирует события по кодам вне потока интерфейса.
+        """
+        try:
+            results = LogParser.analyze_events(self.parsed_logs, self.event_codes)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(results)
@@ -1,29 +1,76 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from datetime import datetime
+import logging
 import os
+import threading
+from logging.handlers import RotatingFileHandler
+
+
+_log_path = os.path.join("logs", "app.log")
+_LOG_MAX_BYTES = 1 << 20
+_LOG_BACKUP_COUNT = 3
+_logger = None
+_logger_lock = threading.Lock()
+
+
+def _get_logger():
+    """
+    Возвращает журнал ошибок загрузки, создавая его при первом обращении
+
+    Каталог и обработчик файла журнала создаются один раз, а не при
+    каждой ошибке. Файлы загружаются из фоновых потоков, поэтому создание
+    защищено блокировкой. Журнал ротируется по размеру.
+
+    Возвращает:
+        logging.Logger: Журнал, пишущий в logs/app.log
+    """
+    global _logger
+    with _logger_lock:
+        if _logger is None:
+            os.makedirs(os.path.dirname(_log_path), exist_ok=True)
+            handler = RotatingFileHandler(
+                _log_path,
+                maxBytes=_LOG_MAX_BYTES,
+                backupCount=_LOG_BACKUP_COUNT,
+                encoding="utf-8",
+            )
+            handler.setFormatter(
+                logging.Formatter("%(asctime)s: %(message)s", "%Y-%m-%d %H:%M:%S")
+            )
+            logger = logging.getLogger(__name__)
+            logger.addHandler(handler)
+            logger.setLevel(logging.ERROR)
+            logger.propagate = False
+            _logger = logger
+    return _logger
 
 
 class FileLoader:
     @staticmethod
-    def load_file(file_path):
+    def load_file(file_path, with_size=False):
         """
         Загружает содержимое файла из указанного пути
 
         Аргументы:
             file_path (str): Путь к загружаемому файлу
+            with_size (bool): Вернуть также размер файла в байтах
 
         Возвращает:
             str: Содержимое файла или None в случае ошибки
+            tuple: (содержимое, размер) при with_size=True, (None, 0) в случае ошибки
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                return file.read()
+            # Файл читается целиком в двоичном режиме и декодируется за один
+            # вызов, минуя построчную буферизацию текстового режима
+            with open(file_path, "rb") as file:
+                data = file.read()
+            content = data.decode("utf-8")
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            if with_size:
+                return content, len(data)
+            return content
         except Exception as e:
-            os.makedirs("logs", exist_ok=True)
-            log_path = os.path.join("logs", "app.log")
-            with open(log_path, "a+", encoding="utf-8") as log_file:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                log_file.write(f"{timestamp}: Error loading file: {e}\n")
-            return None
+            _get_logger().error("Error loading %s: %s", file_path, e)
+            return (None, 0) if with_size else None
@@ -1,8 +1,376 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
 import re
-from datetime import datetime
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import time
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+
+from utils.file_loader import FileLoader
+
+
+_HEADER_RE = re.compile(
+    r"(\d{2}:\d{2}:\d{2}\.\d{3})\|(\S+)\s+(.+?)\s+\(([^,]+),(\d+)\):(.+)"
+)
+# Байты дампа разделены одиночными пробелами, а ASCII-колонка отделена
+# двумя и более пробелами; она может начинаться с символов, похожих на
+# шестнадцатеричные ("AB C"), поэтому захват обрывается на первом таком разрыве
+_HEX_RE = re.compile(r"\w+h\s+([0-9A-F]{2}(?: [0-9A-F]{2})*)(?=\s{2}|\s*$)")
+
+# Полезные данные событий в логах устройств часто повторяются, поэтому
+# результаты разбора кэшируются по байтам записи
+_PARSE_CACHE_SIZE = 4096
+
+
+def _parse_ts(ts):
+    """
+    Разбирает метку времени записи формата ЧЧ:ММ:СС.ммм
+
+    Формат фиксирован регулярным выражением заголовка, поэтому поля
+    читаются по позициям без strptime.
+
+    Аргументы:
+        ts (str): Метка времени из заголовка записи
+
+    Возвращает:
+        time: Время записи
+    """
+    return time(int(ts[0:2]), int(ts[3:5]), int(ts[6:8]), int(ts[9:12]) * 1000)
+
+
+# Фиксированная раскладка данных события 0x23 (58 байт после заголовка)
+_BANKNOTE_LAYOUT = struct.Struct("<B4s2s4sBB3sB32s4sBB2sB")
+
+# Раскладки данных события 0x24 для форматов KD, KR1 и KR2
+_KD_LAST_LAYOUT = struct.Struct("<4B")
+_KD_TOTAL_LAYOUT = struct.Struct("<3H")
+_KR1_LAYOUT = struct.Struct("<6H")
+_KR2_LAYOUT = struct.Struct("<BBHBBBBBHBBBB")
+
+_BANKNOTE_FIELDS = (
+    "banknote_no",
+    "recognition_code",
+    "recognition_error",
+    "encoder",
+    "note_destination",
+    "reserved1",
+    "reserved2",
+    "serial_size",
+    "serial",
+    "denom_info",
+    "denom_use_flag",
+    "decimal_point",
+    "banknote_extens",
+    "sc_error",
+)
+
+# Таблица для bytes.translate: печатные ASCII-символы сохраняются,
+# остальные байты серийного номера заменяются на "?"
+_PRINTABLE_TBL = bytes(b if 32 <= b <= 126 else 0x3F for b in range(256))
+
+_DENOM_MAP = {
+    100: "100 руб",
+    200: "200 руб",
+    500: "500 руб",
+    1000: "1000 руб",
+    2000: "2000 руб",
+    5000: "5000 руб",
+    0x64: "100 руб",
+    0xF4: "500 руб",
+    0x01F4: "500 руб",
+}
+
+_DEST_MAP = {
+    0: "Reject",
+    1: "Cassette",
+    2: "Drum1",
+    3: "Drum2",
+    4: "Drum3",
+    5: "Drum4",
+}
+
+_SC_ERROR_MAP = {
+    0: "Нет",
+    1: "Ошибка распознавания",
+    2: "Результат отклонения - опция SC",
+    3: "Результат отклонения - потеря информации распознавания",
+    4: "Результат отклонения - Цепочка",
+    5: "Результат отклонения - Превышение размера",
+    6: "Результат отклонения - Неверный укладчик",
+    7: "Результат отклонения - Полная сумма партии",
+    8: "Результат отклонения - Полный счетчик номиналов",
+    9: "Результат отклонения - Несоответствие номинала банкноты",
+}
+
+
+# Поля данных события 0x48 по позициям байтов:
+# (имя, описание, текст ошибки, область применения)
+_ERROR_FIELDS = (
+    ("reverse_motor", "Реверсивный мотор", "Ошибка", "Только серия KDS"),
+    ("insert_motor", "Мотор вставки", "Ошибка", "Только серия KDS"),
+    ("main_trans_motor", "Основной транспортный мотор", "Ошибка", "Общее"),
+    ("insert_pusher", "Толкатель вставки", "Ошибка", "Только серия KDS"),
+    ("reject_shutter", "Шторка отклонения", "Ошибка", "Только серия KDS"),
+    ("rail_switch", "Рельсовый переключатель", "Открыт", "Общее"),
+    ("hopper_sensor", "Сенсор лотка", "Обнаружен сигнал", "Общее"),
+    (
+        "interval_control_sensor",
+        "Сенсор контроля интервала",
+        "Обнаружен сигнал",
+        "Только серия KDS",
+    ),
+    ("insert_sensor", "Сенсор вставки", "Обнаружен сигнал", "Общее"),
+    ("sepa_sensor", "Сенсор SEPA", "Обнаружен сигнал", "Общее"),
+    (
+        "reject_counter_sensor",
+        "Сенсор счетчика отклонений",
+        "Обнаружен сигнал",
+        "Общее",
+    ),
+    ("deposit_counter_sensor", "Сенсор счетчика внесения", "Обнаружен сигнал", "Общее"),
+    (
+        "reject_pocket_sensor1",
+        "Сенсор кармана отклонения 1 (внутренний)",
+        "Обнаружен сигнал",
+        "Общее",
+    ),
+    (
+        "reject_pocket_sensor2",
+        "Сенсор кармана отклонения 2 (внешний)",
+        "Обнаружен сигнал",
+        "Только серия KDS",
+    ),
+    (
+        "upper_interface_board_connect",
+        "Подключение верхней интерфейсной платы",
+        "Ошибка",
+        "Только серия KDS",
+    ),
+    ("reco_communication", "Связь с системой распознавания", "Ошибка", "Общее"),
+    ("fpga_communication", "Связь с FPGA", "Ошибка", "Общее"),
+    ("hsc_communication", "Связь с HSC", "Ошибка", "Только серия KDS"),
+    ("safebox_trans_motor", "Транспортный мотор сейфа", "Ошибка", "Только серия KDS"),
+    ("safebox_door_switch", "Переключатель дверцы сейфа", "Открыт", "Общее"),
+    (
+        "safebox_deposit_counter_sensor",
+        "Сенсор счетчика внесения в сейф",
+        "Обнаружен сигнал",
+        "Только серия KDS",
+    ),
+    ("safebox_full_sensor", "Сенсор заполнения сейфа", "Полный", "Общее"),
+    (
+        "heatsealing_module",
+        "Модуль термосклеивания или мотор конверта",
+        "Ошибка",
+        "Только серия KDS",
+    ),
+    (
+        "heatsealing_module_rail_switch",
+        "Рельсовый переключатель модуля термосклеивания",
+        "Открыт",
+        "Только серия KDS",
+    ),
+    (
+        "canvas_bag_switch",
+        "Переключатель холщового мешка или сенсор обнаружения виниловой сумки",
+        "Открыт",
+        "Общее",
+    ),
+    (
+        "envelope_deposit",
+        "Внесение конверта (холщовый мешок)",
+        "Ошибка",
+        "Только серия KDS",
+    ),
+    (
+        "insert_pusher_up_sensor",
+        "Сенсор верхнего положения толкателя вставки",
+        "Ошибка",
+        "Только серия KDS",
+    ),
+    (
+        "insert_pusher_down_sensor",
+        "Сенсор нижнего положения толкателя вставки",
+        "Ошибка",
+        "Только серия KDS",
+    ),
+    (
+        "reject_shutter_open_sensor",
+        "Сенсор открытия шторки отклонения",
+        "Ошибка",
+        "Только серия KDS",
+    ),
+    (
+        "reject_shutter_close_sensor",
+        "Сенсор закрытия шторки отклонения",
+        "Ошибка",
+        "Только серия KDS",
+    ),
+    (
+        "insert_motor_check_sensor",
+        "Сенсор проверки мотора вставки",
+        "Ошибка",
+        "Только серия KDS",
+    ),
+    (
+        "main_trans_motor_check_sensor",
+        "Сенсор проверки основного транспортного мотора",
+        "Ошибка",
+        "Только серия KDS",
+    ),
+    ("banknote_trans_fail", "Сбой транспортировки банкноты", "Ошибка", "Общее"),
+    (
+        "cassette_puser_error",
+        "Ошибка толкателя кассеты",
+        "Ошибка",
+        "Только серия KD-Только кассета",
+    ),
+    ("jam_sensor", "Сенсор замятия", "Обнаружен сигнал", "Только серия KD"),
+    ("enter_sensor", "Сенсор входа", "Обнаружен сигнал", "Только серия KD"),
+    (
+        "cassette_count_sensor",
+        "Сенсор счетчика кассеты",
+        "Ошибка",
+        "Только серия KD-Только кассета",
+    ),
+    (
+        "cassette_banknote_stay_error",
+        "Ошибка остановки банкноты в кассете",
+        "Ошибка",
+        "Только серия KD-Только кассета",
+    ),
+    ("l_path_sensor", "Сенсор L-пути", "Ошибка", "Только серия KR10"),
+    ("l_jam1_sensor", "Сенсор замятия L1", "Ошибка", "Только серия KR10"),
+    ("l_jam2_sensor", "Сенсор замятия L2", "Ошибка", "Только серия KR10"),
+    ("l_jam3_sensor", "Сенсор замятия L3", "Ошибка", "Только серия KR10"),
+    ("drum1_sensor", "Сенсор барабана 1", "Ошибка", "Только серия KR10"),
+    ("drum2_sensor", "Сенсор барабана 2", "Ошибка", "Только серия KR10"),
+    ("drum3_sensor", "Сенсор барабана 3", "Ошибка", "Только серия KR10"),
+    ("drum4_sensor", "Сенсор барабана 4", "Ошибка", "Только серия KR10"),
+    ("l_door_switch", "Переключатель L-дверцы", "Открыт", "Только серия KR10"),
+    ("l_rail_switch", "Переключатель L-рельса", "Открыт", "Только серия KR10"),
+    ("drum1_full_pi", "Индикатор заполнения барабана 1", "Ошибка", "Только серия KR10"),
+    ("drum2_full_pi", "Индикатор заполнения барабана 2", "Ошибка", "Только серия KR10"),
+    ("drum3_full_pi", "Индикатор заполнения барабана 3", "Ошибка", "Только серия KR10"),
+    ("drum4_full_pi", "Индикатор заполнения барабана 4", "Ошибка", "Только серия KR10"),
+    ("reserved1", "Зарезервировано", "", ""),
+    ("reserved2", "Зарезервировано", "", ""),
+    ("reserved3", "Зарезервировано", "", ""),
+    ("reserved4", "Зарезервировано", "", ""),
+    ("reserved5", "Зарезервировано", "", ""),
+    ("reserved6", "Зарезервировано", "", ""),
+    ("reserved7", "Зарезервировано", "", ""),
+    ("reserved8", "Зарезервировано", "", ""),
+)
+
+_BANKNOTE_TRANS_FAIL_DESC = {
+    0: "Нет",
+    1: "Ошибка несоответствия BID",
+    2: "Ошибка неправильного укладчика (для разделителя верхнего модуля)",
+    3: "Ошибка разрыва банкноты",
+    4: "Ошибка двойной цепочки",
+    5: "Ошибка темной цепочки",
+    6: "Ошибка белой цепочки",
+    7: "Ошибка вставки",
+    8: "Полная сумма партии",
+    0x10: "Ошибка неправильного укладчика при отклонении (для выдачи)",
+    0x11: "Ошибка неправильного укладчика кассеты",
+    0x12: "Ошибка неправильного укладчика барабана 1",
+    0x13: "Ошибка неправильного укладчика барабана 2",
+    0x14: "Ошибка неправильного укладчика барабана 3",
+    0x15: "Ошибка неправильного укладчика барабана 4",
+}
+
+# Категории полей 0x48 для подбора рекомендуемых действий
+ERROR_SENSOR = 1
+ERROR_JAM = 2
+ERROR_MOTOR = 4
+ERROR_COMMUNICATION = 8
+ERROR_SWITCH = 16
+
+_ERROR_CATEGORY_KEYWORDS = (
+    ("sensor", ERROR_SENSOR),
+    ("jam", ERROR_JAM),
+    ("motor", ERROR_MOTOR),
+    ("communication", ERROR_COMMUNICATION),
+    ("switch", ERROR_SWITCH),
+    ("door", ERROR_SWITCH),
+)
+
+# Битовые маски категорий для каждой позиции _ERROR_FIELDS
+_ERROR_FIELD_FLAGS = tuple(
+    sum({flag for keyword, flag in _ERROR_CATEGORY_KEYWORDS if keyword in name})
+    for name, _, _, _ in _ERROR_FIELDS
+)
+
+
+def _collect_hex(hex_parts, line):
+    """
+    Добавляет байты строки шестнадцатеричного дампа к фрагментам записи
+
+    Аргументы:
+        hex_parts (list): Шестнадцатеричные фрагменты строк дампа записи
+        line (str): Строка записи после заголовка
+    """
+    if "HEX DUMP" in line:
+        return
+    hex_match = _HEX_RE.match(line)
+    if hex_match:
+        hex_parts.append(hex_match.group(1))
+
+
+def _make_entry(header, hex_parts):
+    """
+    Собирает запись лога из полей заголовка и фрагментов дампа
+
+    Аргументы:
+        header (tuple): Группы регулярного выражения заголовка
+        hex_parts (list): Шестнадцатеричные фрагменты строк дампа
+
+    Возвращает:
+        dict: Разобранная запись лога
+    """
+    timestamp, identifier, event_type, source_file, line_number, function = header
+
+    # bytes.fromhex пропускает пробелы между байтами сам
+    hex_values = bytes.fromhex(" ".join(hex_parts))
+
+    # Заголовки записей повторяются тысячи раз, поэтому строки
+    # интернируются, а исходный блок текста в записи не хранится
+    entry = {
+        "timestamp": timestamp,
+        "timestamp_obj": _parse_ts(timestamp),
+        "identifier": sys.intern(identifier),
+        "event_type": sys.intern(event_type),
+        "source_file": sys.intern(source_file),
+        "line_number": sys.intern(line_number),
+        "function": sys.intern(function),
+        "hex_data": hex_values,
+    }
+
+    if len(hex_values) > 2:
+        entry["event_code"] = hex_values[2]
+
+    return entry
+
+
+def _parse_file(file_path):
+    """
+    Загружает и разбирает один лог-файл (выполняется в дочернем процессе)
+
+    Аргументы:
+        file_path (str): Путь к лог-файлу
+
+    Возвращает:
+        list: Список разобранных записей лога или пустой список при ошибке загрузки
+    """
+    content = FileLoader.load_file(file_path)
+    return LogParser.parse_log(content) if content else []
 
 
 class LogParser:
@@ -15,59 +383,74 @@ class LogParser:
             log_text (str): Необработанное содержимое лога
 
         Возвращает:
-            list: Список разобранных записей лога
+            list: Список разобранных записей лога в порядке следования в файле
         """
-        entries = []
+        return list(LogParser.iter_log(log_text))
 
-        log_blocks = re.split(r"\n\s*\n", log_text.strip())
+    @staticmethod
+    def parse_files(file_paths, max_workers=None):
+        """
+        Разбирает несколько лог-файлов параллельно в отдельных процессах
 
-        for block in log_blocks:
-            if not block.strip():
-                continue
+        Разбор ограничен GIL, поэтому файлы распределяются по процессам,
+        а не по потокам. Один файл разбирается в текущем процессе.
 
-            lines = block.strip().split("\n")
-            if len(lines) < 2:
-                continue
+        Аргументы:
+            file_paths (list): Пути к лог-файлам
+            max_workers (int): Число процессов, по умолчанию os.cpu_count()
 
-            header_match = re.match(
-                r"(\d{2}:\d{2}:\d{2}\.\d{3})\|([^\ ]+)\s+(.+?)\s+\(([^,]+),(\d+)\):(.+)",
-                lines[0],
-            )
-            if not header_match:
-                continue
+        Возвращает:
+            list: Списки разобранных записей в порядке file_paths
+        """
+        file_paths = list(file_paths)
+        if len(file_paths) <= 1:
+            return [_parse_file(path) for path in file_paths]
 
-            timestamp, identifier, event_type, source_file, line_number, function = (
-                header_match.groups()
-            )
+        workers = min(len(file_paths), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_parse_file, file_paths))
 
-            hex_data = ""
-            for i in range(1, len(lines)):
-                if "HEX DUMP" in lines[i]:
-                    continue
-                hex_match = re.match(r"\w+h\s+([0-9A-F\s]+)\s+.+", lines[i])
-                if hex_match:
-                    hex_data += hex_match.group(1).strip() + " "
-
-            hex_values = [int(x, 16) for x in hex_data.strip().split() if x]
-
-            entry = {
-                "timestamp": timestamp,
-                "timestamp_obj": datetime.strptime(timestamp, "%H:%M:%S.%f"),
-                "identifier": identifier,
-                "event_type": event_type,
-                "source_file": source_file,
-                "line_number": line_number,
-                "function": function,
-                "hex_data": hex_values,
-                "raw_block": block,
-            }
+    @staticmethod
+    def iter_log(log_text):
+        """
+        Последовательно разбирает записи лога за один проход по строкам
+
+        Записи разделены пустыми строками: первая строка записи является
+        заголовком, остальные содержат шестнадцатеричный дамп. Записи из
+        одного заголовка пропускаются.
+
+        Аргументы:
+            log_text (str): Необработанное содержимое лога
 
-            if len(hex_values) > 2:
-                entry["event_code"] = hex_values[2]
+        Возвращает:
+            generator: Разобранные записи лога в порядке следования
+        """
+        header = None
+        in_block = False
+        has_body = False
+        hex_parts = []
+
+        # Пустая строка в конце закрывает последнюю запись
+        for line in chain(log_text.split("\n"), ("",)):
+            if not line.strip():
+                if header is not None and has_body:
+                    yield _make_entry(header, hex_parts)
+                header = None
+                in_block = False
+                has_body = False
+                hex_parts = []
+                continue
 
-            entries.append(entry)
+            if not in_block:
+                in_block = True
+                header_match = _HEADER_RE.match(line.lstrip())
+                if header_match:
+                    header = header_match.groups()
+                continue
 
-        return entries
+            if header is not None:
+                has_body = True
+                _collect_hex(hex_parts, line)
 
     @staticmethod
     def analyze_events(parsed_logs, event_codes=None):
@@ -93,143 +476,107 @@ class LogParser:
         for code in event_codes:
             results["events_by_code"][code] = []
 
+        # Привязанные методы append по коду: один поиск в словаре на запись,
+        # записи без кода (None) и с посторонними кодами пропускаются
+        append_by_code = {
+            code: events.append for code, events in results["events_by_code"].items()
+        }
         for entry in parsed_logs:
-            if "event_code" in entry and entry["event_code"] in event_codes:
-                code = entry["event_code"]
-                results["events_by_code"][code].append(entry)
+            append = append_by_code.get(entry.get("event_code"))
+            if append is not None:
+                append(entry)
 
         for code, description in event_codes.items():
             events = results["events_by_code"].get(code, [])
+            # Записи идут в порядке файла, то есть хронологически, поэтому
+            # первое и последнее появление берутся с краев списка. Это верно
+            # и для логов, переходящих через полночь, где время суток убывает
+            first = events[0] if events else None
+            last = events[-1] if events else None
             results["event_summary"][code] = {
                 "description": description,
                 "count": len(events),
-                "first_occurrence": (
-                    min([e["timestamp_obj"] for e in events]) if events else None
-                ),
-                "last_occurrence": (
-                    max([e["timestamp_obj"] for e in events]) if events else None
-                ),
+                "first_occurrence": first["timestamp_obj"] if first else None,
+                "last_occurrence": last["timestamp_obj"] if last else None,
+                "first_timestamp": first["timestamp"] if first else None,
+                "last_timestamp": last["timestamp"] if last else None,
             }
 
         return results
 
     @staticmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
     def parse_banknote_info(hex_data):
         """
         Разбирает информацию о банкноте из кода события 0x23
 
         Аргументы:
-            hex_data (list): Список шестнадцатеричных значений
+            hex_data (bytes): Байты данных записи
 
         Возвращает:
-            dict: Разобранная информация о банкноте
+            Mapping: Разобранная информация о банкноте (кэшируется, только для чтения)
         """
         if len(hex_data) < 58:
-            return {"error": "Неполные данные о банкноте"}
+            return MappingProxyType({"error": "Неполные данные о банкноте"})
 
         data_start_index = 3
 
         if len(hex_data) < data_start_index + 58:
-            return {"error": "Неполные данные о банкноте"}
-
-        data = hex_data[data_start_index:]
+            return MappingProxyType({"error": "Неполные данные о банкноте"})
 
-        banknote_info = {
-            "banknote_no": data[0],
-            "recognition_code": data[1:5],
-            "recognition_error": data[5:7],
-            "encoder": data[7:11],
-            "note_destination": data[11],
-            "reserved1": data[12],
-            "reserved2": data[13:16],
-            "serial_size": data[16],
-            "serial": data[17:49],
-            "denom_info": data[49:53],
-            "denom_use_flag": data[53],
-            "decimal_point": data[54],
-            "banknote_extens": data[55:57],
-            "sc_error": data[57],
-        }
+        banknote_info = dict(
+            zip(
+                _BANKNOTE_FIELDS,
+                _BANKNOTE_LAYOUT.unpack_from(hex_data, data_start_index),
+            )
+        )
 
         denom_bytes = banknote_info["denom_info"]
         denom_value_le = denom_bytes[0] + (denom_bytes[1] << 8)
-        denom_map = {
-            100: "100 руб",
-            200: "200 руб",
-            500: "500 руб",
-            1000: "1000 руб",
-            2000: "2000 руб",
-            5000: "5000 руб",
-            0x64: "100 руб",
-            0xF4: "500 руб",
-            0x01F4: "500 руб",
-        }
 
-        if denom_value_le in denom_map:
-            banknote_info["denomination"] = denom_map[denom_value_le]
+        if denom_value_le in _DENOM_MAP:
+            banknote_info["denomination"] = _DENOM_MAP[denom_value_le]
         else:
             hex_form = f"{denom_value_le:04X}"
             banknote_info["denomination"] = f"Неизвестный номинал (hex: {hex_form})"
 
-        dest_map = {
-            0: "Reject",
-            1: "Cassette",
-            2: "Drum1",
-            3: "Drum2",
-            4: "Drum3",
-            5: "Drum4",
-        }
-        banknote_info["destination_text"] = dest_map.get(
+        banknote_info["destination_text"] = _DEST_MAP.get(
             banknote_info["note_destination"], "Неизвестно"
         )
 
-        sc_error_map = {
-            0: "Нет",
-            1: "Ошибка распознавания",
-            2: "Результат отклонения - опция SC",
-            3: "Результат отклонения - потеря информации распознавания",
-            4: "Результат отклонения - Цепочка",
-            5: "Результат отклонения - Превышение размера",
-            6: "Результат отклонения - Неверный укладчик",
-            7: "Результат отклонения - Полная сумма партии",
-            8: "Результат отклонения - Полный счетчик номиналов",
-            9: "Результат отклонения - Несоответствие номинала банкноты",
-        }
-        banknote_info["sc_error_text"] = sc_error_map.get(
+        banknote_info["sc_error_text"] = _SC_ERROR_MAP.get(
             banknote_info["sc_error"], "Неизвестная ошибка"
         )
 
         if banknote_info["serial_size"] > 0 and banknote_info["serial_size"] <= 32:
             serial_bytes = banknote_info["serial"][: banknote_info["serial_size"]]
-            try:
-                banknote_info["serial_text"] = "".join(
-                    [chr(b) if 32 <= b <= 126 else "?" for b in serial_bytes]
-                )
-            except:
-                banknote_info["serial_text"] = "Невозможно декодировать"
+            banknote_info["serial_text"] = serial_bytes.translate(
+                _PRINTABLE_TBL
+            ).decode("ascii")
         else:
             banknote_info["serial_text"] = "Н/Д"
 
-        return banknote_info
+        return MappingProxyType(banknote_info)
 
     @staticmethod
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
     def parse_count_info(hex_data):
         """
         Разбирает информацию о счете из кода события 0x24
 
         Аргументы:
-            hex_data (list): Список шестнадцатеричных значений
+            hex_data (bytes): Байты данных записи
 
         Возвращает:
-            dict: Разобранная информация о счете
+            Mapping: Разобранная информация о счете (кэшируется, только для чтения)
         """
         if len(hex_data) < 4:
-            return {"error": "Неполные данные счета"}
+            return MappingProxyType({"error": "Неполные данные счета"})
 
         data_start_index = 3
 
         if len(hex_data) < data_start_index + 4:
-            return {"error": "Неполные данные счета"}
+            return MappingProxyType({"error": "Неполные данные счета"})
 
         data = hex_data[data_start_index:]
         data_length = len(data)
@@ -237,485 +584,113 @@ class LogParser:
 
         if data_length >= 8:
             result["format"] = "KD"
-            result["insert_count_last"] = data[0]
-            result["deposit_count_last"] = data[1]
-            result["reject_count_last"] = data[2]
-            result["insert_try_count"] = data[3]
+            (
+                result["insert_count_last"],
+                result["deposit_count_last"],
+                result["reject_count_last"],
+                result["insert_try_count"],
+            ) = _KD_LAST_LAYOUT.unpack_from(data)
 
             if data_length >= 10:
-                result["insert_count_total"] = data[4] + (data[5] << 8)
-                result["deposit_count_total"] = data[6] + (data[7] << 8)
-                result["reject_count_total"] = data[8] + (data[9] << 8)
+                (
+                    result["insert_count_total"],
+                    result["deposit_count_total"],
+                    result["reject_count_total"],
+                ) = _KD_TOTAL_LAYOUT.unpack_from(data, 4)
 
         elif data_length == 12:
             result["format"] = "KR1"
 
-            result["reject_count"] = data[0] + (data[1] << 8)
-            result["cassette_count"] = data[2] + (data[3] << 8)
-            result["drum1_count"] = data[4] + (data[5] << 8)
-            result["drum2_count"] = data[6] + (data[7] << 8)
-            result["drum3_count"] = data[8] + (data[9] << 8)
-            result["drum4_count"] = data[10] + (data[11] << 8)
+            (
+                result["reject_count"],
+                result["cassette_count"],
+                result["drum1_count"],
+                result["drum2_count"],
+                result["drum3_count"],
+                result["drum4_count"],
+            ) = _KR1_LAYOUT.unpack_from(data)
 
         elif data_length >= 14:
             result["format"] = "KR2"
 
-            result["insert_count_last"] = data[0]
-            result["reject_count_last"] = data[1]
-
-            result["cassette_count_last"] = data[2] + (data[3] << 8)
-
-            result["drum_direction"] = "Внесение" if data[4] == 1 else "Выдача"
-
-            result["drum1_count_last"] = data[5]
-            result["drum2_count_last"] = data[6]
-            result["drum3_count_last"] = data[7]
-            result["drum4_count_last"] = data[8]
-
-            result["cassette_count_total"] = data[9] + (data[10] << 8)
-
-            result["drum1_count_total"] = data[11]
-            result["drum2_count_total"] = data[12]
-            result["drum3_count_total"] = data[13]
-            result["drum4_count_total"] = data[14]
+            (
+                result["insert_count_last"],
+                result["reject_count_last"],
+                result["cassette_count_last"],
+                result["drum_direction"],
+                result["drum1_count_last"],
+                result["drum2_count_last"],
+                result["drum3_count_last"],
+                result["drum4_count_last"],
+                result["cassette_count_total"],
+                result["drum1_count_total"],
+                result["drum2_count_total"],
+                result["drum3_count_total"],
+                result["drum4_count_total"],
+            ) = _KR2_LAYOUT.unpack_from(data)
+
+            result["drum_direction"] = (
+                "Внесение" if result["drum_direction"] == 1 else "Выдача"
+            )
 
-        return result
+        return MappingProxyType(result)
 
     @staticmethod
-    def parse_error_info(hex_data):
+    @lru_cache(maxsize=_PARSE_CACHE_SIZE)
+    def parse_error_info(hex_data, full=False):
         """
         Разбирает информацию об ошибках из кода события 0x48
 
         Аргументы:
-            hex_data (list): Список шестнадцатеричных значений
+            hex_data (bytes): Байты данных записи
+            full (bool): Заполнить также словарь fields с состоянием каждого
+                компонента; сводке ошибок достаточно active_errors
 
         Возвращает:
-            dict: Разобранная информация об ошибках
+            Mapping: Разобранная информация об ошибках (кэшируется, только
+                для чтения); action_flags содержит объединение категорий
+                ERROR_* сработавших полей
         """
         if len(hex_data) < 4:
-            return {"error": "Неполные данные об ошибках"}
+            return MappingProxyType({"error": "Неполные данные об ошибках"})
 
         data_start_index = 3
 
         data = hex_data[data_start_index:]
         result = {"raw_data": data, "errors_detected": False}
 
-        error_fields = {
-            0: {
-                "name": "reverse_motor",
-                "description": "Реверсивный мотор",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            1: {
-                "name": "insert_motor",
-                "description": "Мотор вставки",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            2: {
-                "name": "main_trans_motor",
-                "description": "Основной транспортный мотор",
-                "error_desc": "Ошибка",
-                "scope": "Общее",
-            },
-            3: {
-                "name": "insert_pusher",
-                "description": "Толкатель вставки",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            4: {
-                "name": "reject_shutter",
-                "description": "Шторка отклонения",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            5: {
-                "name": "rail_switch",
-                "description": "Рельсовый переключатель",
-                "error_desc": "Открыт",
-                "scope": "Общее",
-            },
-            6: {
-                "name": "hopper_sensor",
-                "description": "Сенсор лотка",
-                "error_desc": "Обнаружен сигнал",
-                "scope": "Общее",
-            },
-            7: {
-                "name": "interval_control_sensor",
-                "description": "Сенсор контроля интервала",
-                "error_desc": "Обнаружен сигнал",
-                "scope": "Только серия KDS",
-            },
-            8: {
-                "name": "insert_sensor",
-                "description": "Сенсор вставки",
-                "error_desc": "Обнаружен сигнал",
-                "scope": "Общее",
-            },
-            9: {
-                "name": "sepa_sensor",
-                "description": "Сенсор SEPA",
-                "error_desc": "Обнаружен сигнал",
-                "scope": "Общее",
-            },
-            10: {
-                "name": "reject_counter_sensor",
-                "description": "Сенсор счетчика отклонений",
-                "error_desc": "Обнаружен сигнал",
-                "scope": "Общее",
-            },
-            11: {
-                "name": "deposit_counter_sensor",
-                "description": "Сенсор счетчика внесения",
-                "error_desc": "Обнаружен сигнал",
-                "scope": "Общее",
-            },
-            12: {
-                "name": "reject_pocket_sensor1",
-                "description": "Сенсор кармана отклонения 1 (внутренний)",
-                "error_desc": "Обнаружен сигнал",
-                "scope": "Общее",
-            },
-            13: {
-                "name": "reject_pocket_sensor2",
-                "description": "Сенсор кармана отклонения 2 (внешний)",
-                "error_desc": "Обнаружен сигнал",
-                "scope": "Только серия KDS",
-            },
-            14: {
-                "name": "upper_interface_board_connect",
-                "description": "Подключение верхней интерфейсной платы",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            15: {
-                "name": "reco_communication",
-                "description": "Связь с системой распознавания",
-                "error_desc": "Ошибка",
-                "scope": "Общее",
-            },
-            16: {
-                "name": "fpga_communication",
-                "description": "Связь с FPGA",
-                "error_desc": "Ошибка",
-                "scope": "Общее",
-            },
-            17: {
-                "name": "hsc_communication",
-                "description": "Связь с HSC",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            18: {
-                "name": "safebox_trans_motor",
-                "description": "Транспортный мотор сейфа",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            19: {
-                "name": "safebox_door_switch",
-                "description": "Переключатель дверцы сейфа",
-                "error_desc": "Открыт",
-                "scope": "Общее",
-            },
-            20: {
-                "name": "safebox_deposit_counter_sensor",
-                "description": "Сенсор счетчика внесения в сейф",
-                "error_desc": "Обнаружен сигнал",
-                "scope": "Только серия KDS",
-            },
-            21: {
-                "name": "safebox_full_sensor",
-                "description": "Сенсор заполнения сейфа",
-                "error_desc": "Полный",
-                "scope": "Общее",
-            },
-            22: {
-                "name": "heatsealing_module",
-                "description": "Модуль термосклеивания или мотор конверта",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            23: {
-                "name": "heatsealing_module_rail_switch",
-                "description": "Рельсовый переключатель модуля термосклеивания",
-                "error_desc": "Открыт",
-                "scope": "Только серия KDS",
-            },
-            24: {
-                "name": "canvas_bag_switch",
-                "description": "Переключатель холщового мешка или сенсор обнаружения виниловой сумки",
-                "error_desc": "Открыт",
-                "scope": "Общее",
-            },
-            25: {
-                "name": "envelope_deposit",
-                "description": "Внесение конверта (холщовый мешок)",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            26: {
-                "name": "insert_pusher_up_sensor",
-                "description": "Сенсор верхнего положения толкателя вставки",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            27: {
-                "name": "insert_pusher_down_sensor",
-                "description": "Сенсор нижнего положения толкателя вставки",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            28: {
-                "name": "reject_shutter_open_sensor",
-                "description": "Сенсор открытия шторки отклонения",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            29: {
-                "name": "reject_shutter_close_sensor",
-                "description": "Сенсор закрытия шторки отклонения",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            30: {
-                "name": "insert_motor_check_sensor",
-                "description": "Сенсор проверки мотора вставки",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            31: {
-                "name": "main_trans_motor_check_sensor",
-                "description": "Сенсор проверки основного транспортного мотора",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KDS",
-            },
-            32: {
-                "name": "banknote_trans_fail",
-                "description": "Сбой транспортировки банкноты",
-                "error_desc": "Ошибка",
-                "scope": "Общее",
-            },
-            33: {
-                "name": "cassette_puser_error",
-                "description": "Ошибка толкателя кассеты",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KD-Только кассета",
-            },
-            34: {
-                "name": "jam_sensor",
-                "description": "Сенсор замятия",
-                "error_desc": "Обнаружен сигнал",
-                "scope": "Только серия KD",
-            },
-            35: {
-                "name": "enter_sensor",
-                "description": "Сенсор входа",
-                "error_desc": "Обнаружен сигнал",
-                "scope": "Только серия KD",
-            },
-            36: {
-                "name": "cassette_count_sensor",
-                "description": "Сенсор счетчика кассеты",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KD-Только кассета",
-            },
-            37: {
-                "name": "cassette_banknote_stay_error",
-                "description": "Ошибка остановки банкноты в кассете",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KD-Только кассета",
-            },
-            38: {
-                "name": "l_path_sensor",
-                "description": "Сенсор L-пути",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KR10",
-            },
-            39: {
-                "name": "l_jam1_sensor",
-                "description": "Сенсор замятия L1",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KR10",
-            },
-            40: {
-                "name": "l_jam2_sensor",
-                "description": "Сенсор замятия L2",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KR10",
-            },
-            41: {
-                "name": "l_jam3_sensor",
-                "description": "Сенсор замятия L3",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KR10",
-            },
-            42: {
-                "name": "drum1_sensor",
-                "description": "Сенсор барабана 1",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KR10",
-            },
-            43: {
-                "name": "drum2_sensor",
-                "description": "Сенсор барабана 2",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KR10",
-            },
-            44: {
-                "name": "drum3_sensor",
-                "description": "Сенсор барабана 3",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KR10",
-            },
-            45: {
-                "name": "drum4_sensor",
-                "description": "Сенсор барабана 4",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KR10",
-            },
-            46: {
-                "name": "l_door_switch",
-                "description": "Переключатель L-дверцы",
-                "error_desc": "Открыт",
-                "scope": "Только серия KR10",
-            },
-            47: {
-                "name": "l_rail_switch",
-                "description": "Переключатель L-рельса",
-                "error_desc": "Открыт",
-                "scope": "Только серия KR10",
-            },
-            48: {
-                "name": "drum1_full_pi",
-                "description": "Индикатор заполнения барабана 1",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KR10",
-            },
-            49: {
-                "name": "drum2_full_pi",
-                "description": "Индикатор заполнения барабана 2",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KR10",
-            },
-            50: {
-                "name": "drum3_full_pi",
-                "description": "Индикатор заполнения барабана 3",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KR10",
-            },
-            51: {
-                "name": "drum4_full_pi",
-                "description": "Индикатор заполнения барабана 4",
-                "error_desc": "Ошибка",
-                "scope": "Только серия KR10",
-            },
-            52: {
-                "name": "reserved1",
-                "description": "Зарезервировано",
-                "error_desc": "",
-                "scope": "",
-            },
-            53: {
-                "name": "reserved2",
-                "description": "Зарезервировано",
-                "error_desc": "",
-                "scope": "",
-            },
-            54: {
-                "name": "reserved3",
-                "description": "Зарезервировано",
-                "error_desc": "",
-                "scope": "",
-            },
-            55: {
-                "name": "reserved4",
-                "description": "Зарезервировано",
-                "error_desc": "",
-                "scope": "",
-            },
-            56: {
-                "name": "reserved5",
-                "description": "Зарезервировано",
-                "error_desc": "",
-                "scope": "",
-            },
-            57: {
-                "name": "reserved6",
-                "description": "Зарезервировано",
-                "error_desc": "",
-                "scope": "",
-            },
-            58: {
-                "name": "reserved7",
-                "description": "Зарезервировано",
-                "error_desc": "",
-                "scope": "",
-            },
-            59: {
-                "name": "reserved8",
-                "description": "Зарезервировано",
-                "error_desc": "",
-                "scope": "",
-            },
-        }
-
-        banknote_trans_fail_desc = {
-            0: "Нет",
-            1: "Ошибка несоответствия BID",
-            2: "Ошибка неправильного укладчика (для разделителя верхнего модуля)",
-            3: "Ошибка разрыва банкноты",
-            4: "Ошибка двойной цепочки",
-            5: "Ошибка темной цепочки",
-            6: "Ошибка белой цепочки",
-            7: "Ошибка вставки",
-            8: "Полная сумма партии",
-            0x10: "Ошибка неправильного укладчика при отклонении (для выдачи)",
-            0x11: "Ошибка неправильного укладчика кассеты",
-            0x12: "Ошибка неправильного укладчика барабана 1",
-            0x13: "Ошибка неправильного укладчика барабана 2",
-            0x14: "Ошибка неправильного укладчика барабана 3",
-            0x15: "Ошибка неправильного укладчика барабана 4",
-        }
-
-        result["fields"] = {}
+        if full:
+            fields = result["fields"] = {}
         active_errors = []
-
-        for i, field_info in error_fields.items():
-            if i >= len(data):
-                break
-
-            field_value = data[i]
-            field_name = field_info["name"]
-
-            result["fields"][field_name] = {
-                "value": field_value,
-                "description": field_info["description"],
-                "error_desc": field_info["error_desc"],
-                "scope": field_info["scope"],
-            }
+        action_flags = 0
+
+        for field_value, (field_name, description, error_desc, scope), flags in zip(
+            data, _ERROR_FIELDS, _ERROR_FIELD_FLAGS
+        ):
+            if full:
+                fields[field_name] = {
+                    "value": field_value,
+                    "description": description,
+                    "error_desc": error_desc,
+                    "scope": scope,
+                }
 
             if field_name == "banknote_trans_fail" and field_value > 0:
-                result["fields"][field_name]["specific_desc"] = (
-                    banknote_trans_fail_desc.get(
-                        field_value, f"Неизвестный код ошибки: {field_value}"
-                    )
-                )
-                active_errors.append(
-                    f"{field_info['description']}: {result['fields'][field_name]['specific_desc']}"
+                specific_desc = _BANKNOTE_TRANS_FAIL_DESC.get(
+                    field_value, f"Неизвестный код ошибки: {field_value}"
                 )
+                if full:
+                    fields[field_name]["specific_desc"] = specific_desc
+                active_errors.append(f"{description}: {specific_desc}")
                 result["errors_detected"] = True
 
-            elif field_value == 1 and field_info["error_desc"]:
-                active_errors.append(
-                    f"{field_info['description']}: {field_info['error_desc']}"
-                )
+            elif field_value == 1 and error_desc:
+                active_errors.append(f"{description}: {error_desc}")
+                action_flags |= flags
                 result["errors_detected"] = True
 
-        result["active_errors"] = active_errors
+        result["active_errors"] = tuple(active_errors)
         result["active_error_count"] = len(active_errors)
+        result["action_flags"] = action_flags
 
-        return result
+        return MappingProxyType(result)